@@ -1,8 +1,12 @@
 """Azure DevOps API client for PR operations"""
 
+import asyncio
 import logging
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from azure.devops.connection import Connection
 from azure.devops.v7_1.git import GitClient
 from azure.devops.v7_1.git.models import (
@@ -19,12 +23,61 @@ from .config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Bytes that commonly appear in text files; anything else counts towards the binary ratio
+_TEXT_BYTES = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
+
+# Extensions that are always binary, so their content is never fetched for review
+BINARY_FILE_RE = re.compile(
+    r'\.(?:png|jpe?g|gif|bmp|ico|webp|tiff?|pdf|zip|gz|tgz|7z|rar|jar|nupkg|'
+    r'dll|exe|pdb|so|dylib|woff2?|ttf|eot|otf|mp3|mp4|wav|avi)$',
+    re.IGNORECASE
+)
+
+# Upper bound on API requests in flight per PR, kept below the HTTP connection pool size (10)
+MAX_CONCURRENT_FETCHES = 8
+
+# msrest retries 408 and most 5xx responses but not 429; Azure DevOps throttles with 429 and a
+# Retry-After header, which urllib3 waits for when the status is in this list
+RETRY_STATUS_CODES = [408, 429] + [code for code in range(500, 999) if code not in (501, 505)]
+
+# Maximum number of immutable per-commit responses (changes, file contents) kept in memory
+MAX_CACHED_COMMIT_ITEMS = 256
+# File contents are also capped by size, since the client lives as long as the server process
+MAX_CACHED_CONTENT_BYTES = 32 * 1024 * 1024
+MAX_CACHED_CONTENT_ITEM_BYTES = 1024 * 1024
+
+# PR details and changes can change with new pushes, so they are only reused for a short time
+PR_CACHE_TTL_SECONDS = 60
+MAX_CACHED_PULL_REQUESTS = 64
+
+# Test file naming patterns fused into a single regex
+TEST_FILE_RE = re.compile(
+    r'.*\.Tests?\.cs$|.*Test\.cs$|.*Tests\.cs$|.*Spec\.cs$|'
+    r'.*\.test\.(js|ts|jsx|tsx)$|.*\.spec\.(js|ts|jsx|tsx)$|'
+    r'__tests__/.*\.(js|ts|jsx|tsx)$|.*\.e2e\.(js|ts)$|'
+    r'test_.*\.py$|.*_test\.py$',
+    re.IGNORECASE
+)
+
 
 class AzureDevOpsClient:
     def __init__(self, settings: Settings):
         self.settings = settings
         self.connection = None
         self.git_client = None
+        # Responses addressed by commit id never change, so successful ones are reused across reviews
+        self._commit_changes_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._commit_content_cache: "OrderedDict[Tuple[str, str, str], bytes]" = OrderedDict()
+        self._commit_content_bytes = 0
+        # PR-level responses, stored with their expiry time
+        self._pr_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, Any]]" = OrderedDict()
+        self._pr_changes_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, Any]]" = OrderedDict()
+        # PR fetches in progress, shared by concurrent callers asking for the same PR
+        self._pr_fetches: Dict[Tuple[str, str, int], "asyncio.Future"] = {}
+        # Bumped whenever a PR is written to, so fetches started before the write are not cached
+        self._pr_generations: Dict[Tuple[str, str, int], int] = {}
+        # The PAT's profile does not change while the client is alive
+        self._current_user: Optional[Dict[str, Any]] = None
         self._initialize_connection()
     
     def _initialize_connection(self):
@@ -42,11 +95,59 @@ class AzureDevOpsClient:
         
         # Disable Azure CLI authentication fallback
         # This ensures we only use PAT authentication
-        self.git_client = self.connection.clients.get_git_client()
+        self.git_client = self._configure_client(self.connection.clients.get_git_client())
         
         # Log successful connection (without exposing PAT)
         logger.info(f"Connected to Azure DevOps org: {self.settings.azure_organization}")
     
+    @staticmethod
+    def _configure_client(client):
+        """Keep the client's pooled HTTP session open and retry throttled requests"""
+        # msrest closes its requests.Session after every call unless keep_alive is set,
+        # which forces a new TCP/TLS handshake for each API request
+        client.config.keep_alive = True
+        client.config.retry_policy.policy.status_forcelist = RETRY_STATUS_CODES
+        return client
+    
+    def clear_cache(self):
+        """Drop all cached API responses"""
+        self._commit_changes_cache.clear()
+        self._commit_content_cache.clear()
+        self._commit_content_bytes = 0
+        self._pr_cache.clear()
+        self._pr_changes_cache.clear()
+        self._pr_fetches.clear()
+        self._current_user = None
+    
+    def _invalidate_pull_request(self, project: str, repository_id: str, pull_request_id: int):
+        """Forget cached details and changes of a PR after writing to it"""
+        cache_key = (project, repository_id, pull_request_id)
+        self._pr_generations[cache_key] = self._pr_generations.get(cache_key, 0) + 1
+        self._pr_cache.pop(cache_key, None)
+        self._pr_changes_cache.pop(cache_key, None)
+        self._pr_fetches.pop(cache_key, None)
+    
+    @staticmethod
+    def _get_fresh(cache: OrderedDict, cache_key: Tuple[Any, ...]) -> Any:
+        """Return a cached PR-level response that has not expired, or None"""
+        entry = cache.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del cache[cache_key]
+            return None
+        cache.move_to_end(cache_key)
+        return value
+    
+    @staticmethod
+    def _store_fresh(cache: OrderedDict, cache_key: Tuple[Any, ...], value: Any):
+        """Cache a successful PR-level response for PR_CACHE_TTL_SECONDS"""
+        cache[cache_key] = (time.monotonic() + PR_CACHE_TTL_SECONDS, value)
+        cache.move_to_end(cache_key)
+        if len(cache) > MAX_CACHED_PULL_REQUESTS:
+            cache.popitem(last=False)
+    
     async def list_pull_requests(
         self, 
         organization: str,
@@ -70,21 +171,25 @@ class AzureDevOpsClient:
     
     async def get_current_user(self) -> Dict[str, Any]:
         """Get current user information from the connection"""
+        if self._current_user is not None:
+            return self._current_user
+        
         try:
             # Get the current user's identity
             # This requires the profile client or core client
             from azure.devops.v7_1.profile import ProfileClient
-            profile_client = self.connection.clients.get_profile_client()
+            profile_client = self._configure_client(self.connection.clients.get_profile_client())
             
             # Get my profile
             my_profile = profile_client.get_profile("me")
             
-            return {
+            self._current_user = {
                 "id": my_profile.id,
                 "display_name": my_profile.display_name,
                 "email": my_profile.email_address,
                 "unique_name": my_profile.unique_name
             }
+            return self._current_user
         except Exception as e:
             logger.warning(f"Could not get current user profile: {e}")
             # Try alternative method using connection context
@@ -206,13 +311,42 @@ class AzureDevOpsClient:
         pull_request_id: int
     ) -> GitPullRequest:
         """Get details of a specific pull request"""
+        cache_key = (project, repository_id, pull_request_id)
+        cached = self._get_fresh(self._pr_cache, cache_key)
+        if cached is not None:
+            return cached
+        
+        # Join a fetch of the same PR that is already running on this loop
+        fetch = self._pr_fetches.get(cache_key)
+        if fetch is None or fetch.get_loop() is not asyncio.get_running_loop():
+            fetch = asyncio.ensure_future(self._fetch_pull_request(project, repository_id, pull_request_id))
+            self._pr_fetches[cache_key] = fetch
+            fetch.add_done_callback(
+                lambda done: self._pr_fetches.pop(cache_key, None) if self._pr_fetches.get(cache_key) is done else None
+            )
+        # Shielded so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(fetch)
+    
+    async def _fetch_pull_request(
+        self,
+        project: str,
+        repository_id: str,
+        pull_request_id: int
+    ) -> GitPullRequest:
+        """Fetch a pull request from the API and cache it unless it was written to meanwhile"""
+        cache_key = (project, repository_id, pull_request_id)
+        generation = self._pr_generations.get(cache_key, 0)
         try:
-            pr = self.git_client.get_pull_request(
+            # Run the blocking SDK call off the event loop so other requests can proceed
+            pr = await asyncio.to_thread(
+                self.git_client.get_pull_request,
                 repository_id=repository_id,
                 pull_request_id=pull_request_id,
                 project=project
             )
             logger.info(f"Retrieved PR #{pull_request_id}: {pr.title}")
+            if self._pr_generations.get(cache_key, 0) == generation:
+                self._store_fresh(self._pr_cache, cache_key, pr)
             return pr
         except Exception as e:
             logger.error(f"Error getting pull request: {e}")
@@ -252,20 +386,27 @@ class AzureDevOpsClient:
         pull_request_id: int
     ) -> List[Dict[str, Any]]:
         """Get file changes in a pull request - filters out merge commits"""
+        # Callers may modify the change dicts, so the cache holds and hands out copies
+        cache_key = (project, repository_id, pull_request_id)
+        cached = self._get_fresh(self._pr_changes_cache, cache_key)
+        if cached is not None:
+            return [dict(change) for change in cached]
+        generation = self._pr_generations.get(cache_key, 0)
+        
         try:
-            # Get PR to get source and target commits
-            pr = await self.get_pull_request(
-                organization, project, repository_id, pull_request_id
-            )
-            
-            # Get the commits in the PR
-            commits = self.git_client.get_pull_request_commits(
-                repository_id=repository_id,
-                pull_request_id=pull_request_id,
-                project=project
+            # Get PR to get source and target commits, and the commits in the PR, in parallel
+            pr, commits = await asyncio.gather(
+                self.get_pull_request(organization, project, repository_id, pull_request_id),
+                asyncio.to_thread(
+                    self.git_client.get_pull_request_commits,
+                    repository_id=repository_id,
+                    pull_request_id=pull_request_id,
+                    project=project
+                )
             )
             
             changes = []
+            content_fetches = []  # File content requests, run concurrently once all changes are known
             seen_paths = set()  # Track already processed files
             feature_commits = []  # Track non-merge commits
             
@@ -283,15 +424,17 @@ class AzureDevOpsClient:
                 logger.warning("No feature commits found, using all commits")
                 feature_commits = commits
             
+            # All requests below share the client's pooled session, so cap how many run at once
+            fetch_limit = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+            
+            # Get changes for each commit concurrently; results keep commit order for de-duplication
+            all_commit_changes = await asyncio.gather(*(
+                self._get_commit_changes(repository_id, project, commit.commit_id, fetch_limit)
+                for commit in feature_commits
+            ))
+            
             # Process only feature commits
-            for commit in feature_commits:
-                # Get changes for each commit
-                commit_changes = self.git_client.get_changes(
-                    commit_id=commit.commit_id,
-                    repository_id=repository_id,
-                    project=project
-                )
-                
+            for commit, commit_changes in zip(feature_commits, all_commit_changes):
                 for change in commit_changes.changes:
                     # Handle both dictionary and object access patterns
                     item = change.item if hasattr(change, 'item') else change.get('item', {})
@@ -331,90 +474,210 @@ class AzureDevOpsClient:
                         "is_test_file": self._is_test_file(item_path)
                     }
                     
+                    # Known binary files are flagged up front to skip the content fetches entirely
+                    if change_type in ["edit", "add"] and BINARY_FILE_RE.search(item_path):
+                        change_dict["is_binary"] = True
+                        change_dict["new_content"] = ""
+                        change_dict["full_content"] = ""
+                    
                     # Get file content if it's a modification or addition
-                    if change_type in ["edit", "add"]:
-                        try:
-                            # Get NEW content from the commit in the PR
-                            new_content = self.git_client.get_item_content(
-                                repository_id=repository_id,
-                                path=item_path,
-                                project=project,
-                                version_descriptor=GitVersionDescriptor(version=commit.commit_id, version_type="commit")
-                            )
-                            # Content is returned as a generator, need to join it
-                            if new_content:
-                                content_bytes = b''.join(new_content)
-                                change_dict["new_content"] = content_bytes.decode('utf-8')
-                                change_dict["full_content"] = change_dict["new_content"]  # For full file analysis
-                            else:
-                                change_dict["new_content"] = ""
-                                change_dict["full_content"] = ""
-                            
-                            # Get old content for edits to create diff
-                            if change_type == "edit":
-                                try:
-                                    # Get old content from the target branch (what we're comparing against)
-                                    old_content = self.git_client.get_item_content(
-                                        repository_id=repository_id,
-                                        path=item_path,
-                                        project=project,
-                                        version_descriptor=GitVersionDescriptor(
-                                            version=pr.target_ref_name.replace('refs/heads/', ''), 
-                                            version_type="branch"
-                                        )
-                                    )
-                                    # Content is returned as a generator, need to join it
-                                    if old_content:
-                                        content_bytes = b''.join(old_content)
-                                        change_dict["old_content"] = content_bytes.decode('utf-8')
-                                    else:
-                                        change_dict["old_content"] = ""
-                                    
-                                    # Calculate diff summary
-                                    if old_content and change_dict.get("new_content"):
-                                        old_lines = change_dict["old_content"].splitlines()
-                                        new_lines = change_dict["new_content"].splitlines()
-                                        change_dict["lines_added"] = len(new_lines) - len(old_lines)
-                                        change_dict["size_change"] = len(change_dict["new_content"]) - len(change_dict["old_content"])
-                                except:
-                                    change_dict["old_content"] = ""
-                        except Exception as e:
-                            logger.warning(f"Could not get content for {item_path}: {e}")
-                            change_dict["new_content"] = ""
-                            change_dict["old_content"] = ""
-                            change_dict["full_content"] = ""
+                    elif change_type in ["edit", "add"]:
+                        content_fetches.append(self._fetch_change_content(
+                            change_dict, repository_id, project, commit.commit_id,
+                            pr.target_ref_name.replace('refs/heads/', ''), fetch_limit
+                        ))
                     
                     changes.append(change_dict)
             
+            contents_fetched = await asyncio.gather(*content_fetches)
+            
             # Sort changes by path for consistent ordering
             changes.sort(key=lambda x: x["path"])
             
             logger.info(f"Retrieved {len(changes)} file changes for PR #{pull_request_id} (folders excluded)")
+            # Blank contents left by a failed fetch would otherwise be served until the entry expires
+            if all(contents_fetched) and self._pr_generations.get(cache_key, 0) == generation:
+                self._store_fresh(self._pr_changes_cache, cache_key, [dict(change) for change in changes])
             return changes
         except Exception as e:
             logger.error(f"Error getting pull request changes: {e}")
             raise
     
+    async def _get_commit_changes(
+        self,
+        repository_id: str,
+        project: str,
+        commit_id: str,
+        fetch_limit: asyncio.Semaphore
+    ):
+        """Get the changes of a commit, reusing an earlier successful response"""
+        cache_key = (repository_id, commit_id)
+        cached = self._commit_changes_cache.get(cache_key)
+        if cached is not None:
+            self._commit_changes_cache.move_to_end(cache_key)
+            return cached
+        
+        commit_changes = await self._run_limited(
+            fetch_limit,
+            self.git_client.get_changes,
+            commit_id=commit_id,
+            repository_id=repository_id,
+            project=project
+        )
+        self._store_commit_item(self._commit_changes_cache, cache_key, commit_changes)
+        return commit_changes
+    
+    async def _get_commit_item_content(
+        self,
+        repository_id: str,
+        project: str,
+        commit_id: str,
+        path: str
+    ) -> Optional[bytes]:
+        """Get a file's bytes at a commit, reusing an earlier successful download; None if the API returned nothing"""
+        cache_key = (repository_id, commit_id, path)
+        cached = self._commit_content_cache.get(cache_key)
+        if cached is not None:
+            self._commit_content_cache.move_to_end(cache_key)
+            return cached
+        
+        content = await asyncio.to_thread(
+            self.git_client.get_item_content,
+            repository_id=repository_id,
+            path=path,
+            project=project,
+            version_descriptor=GitVersionDescriptor(version=commit_id, version_type="commit")
+        )
+        if not content:
+            return None
+        
+        # Content is returned as a generator, need to join it
+        content_bytes = await asyncio.to_thread(b''.join, content)
+        # Binary files are never reviewed, and large ones would crowd out everything else
+        if len(content_bytes) <= MAX_CACHED_CONTENT_ITEM_BYTES and not self._is_likely_binary(content_bytes):
+            self._store_commit_content(cache_key, content_bytes)
+        return content_bytes
+    
+    def _store_commit_content(self, cache_key: Tuple[str, str, str], content_bytes: bytes):
+        """Cache a file's bytes, evicting the least recently used files to stay within the size budget"""
+        replaced = self._commit_content_cache.pop(cache_key, None)
+        if replaced is not None:
+            self._commit_content_bytes -= len(replaced)
+        self._commit_content_cache[cache_key] = content_bytes
+        self._commit_content_bytes += len(content_bytes)
+        while (self._commit_content_bytes > MAX_CACHED_CONTENT_BYTES
+               or len(self._commit_content_cache) > MAX_CACHED_COMMIT_ITEMS):
+            _, evicted = self._commit_content_cache.popitem(last=False)
+            self._commit_content_bytes -= len(evicted)
+    
+    @staticmethod
+    def _store_commit_item(cache: OrderedDict, cache_key: Tuple[str, ...], value: Any):
+        """Cache a successful per-commit response, evicting the least recently used entry when full"""
+        cache[cache_key] = value
+        if len(cache) > MAX_CACHED_COMMIT_ITEMS:
+            cache.popitem(last=False)
+    
+    async def _run_limited(self, fetch_limit: asyncio.Semaphore, func, **kwargs):
+        """Run a blocking SDK call in a worker thread while holding a slot of the fetch limit"""
+        async with fetch_limit:
+            return await asyncio.to_thread(func, **kwargs)
+    
+    async def _fetch_change_content(
+        self,
+        change_dict: Dict[str, Any],
+        repository_id: str,
+        project: str,
+        commit_id: str,
+        target_branch: str,
+        fetch_limit: asyncio.Semaphore
+    ) -> bool:
+        """Fill in new/old content for a changed file, fetching through the shared client off the event loop
+        
+        Returns False if a fetch failed and the content was left blank, so the result must not be cached
+        """
+        item_path = change_dict["path"]
+        change_type = change_dict["change_type"]
+        async with fetch_limit:
+            try:
+                # Get NEW content from the commit in the PR
+                content_bytes = await self._get_commit_item_content(repository_id, project, commit_id, item_path)
+                if content_bytes is not None:
+                    if self._is_likely_binary(content_bytes):
+                        # Binary files can't be reviewed as text
+                        change_dict["is_binary"] = True
+                        change_dict["new_content"] = ""
+                    else:
+                        change_dict["new_content"] = content_bytes.decode('utf-8')
+                    change_dict["full_content"] = change_dict["new_content"]  # For full file analysis
+                else:
+                    change_dict["new_content"] = ""
+                    change_dict["full_content"] = ""
+                
+                # Get old content for edits to create diff (not needed for binary files)
+                if change_type == "edit" and not change_dict.get("is_binary"):
+                    try:
+                        # Get old content from the target branch (what we're comparing against)
+                        old_content = await asyncio.to_thread(
+                            self.git_client.get_item_content,
+                            repository_id=repository_id,
+                            path=item_path,
+                            project=project,
+                            version_descriptor=GitVersionDescriptor(
+                                version=target_branch, 
+                                version_type="branch"
+                            )
+                        )
+                        # Content is returned as a generator, need to join it
+                        if old_content:
+                            content_bytes = await asyncio.to_thread(b''.join, old_content)
+                            change_dict["old_content"] = content_bytes.decode('utf-8')
+                        else:
+                            change_dict["old_content"] = ""
+                        
+                        # Calculate diff summary
+                        if old_content and change_dict.get("new_content"):
+                            old_lines = change_dict["old_content"].splitlines()
+                            new_lines = change_dict["new_content"].splitlines()
+                            change_dict["lines_added"] = len(new_lines) - len(old_lines)
+                            change_dict["size_change"] = len(change_dict["new_content"]) - len(change_dict["old_content"])
+                    except:
+                        change_dict["old_content"] = ""
+                        return False
+                return True
+            except Exception as e:
+                logger.warning(f"Could not get content for {item_path}: {e}")
+                change_dict["new_content"] = ""
+                change_dict["old_content"] = ""
+                change_dict["full_content"] = ""
+                return False
+    
     def _is_test_file(self, file_path: str) -> bool:
         """Check if a file is a test file based on naming patterns"""
-        import re
+        return TEST_FILE_RE.search(file_path) is not None
+    
+    def _is_likely_binary(self, content_bytes: bytes, sample_size: int = 8192) -> bool:
+        """Check if file content looks binary based on a sample of its bytes"""
+        sample = content_bytes[:sample_size]
         
-        test_patterns = [
-            r'.*\.Tests?\.cs$',
-            r'.*Test\.cs$',
-            r'.*Tests\.cs$',
-            r'.*Spec\.cs$',
-            r'.*\.test\.(js|ts|jsx|tsx)$',
-            r'.*\.spec\.(js|ts|jsx|tsx)$',
-            r'__tests__/.*\.(js|ts|jsx|tsx)$',
-            r'.*\.e2e\.(js|ts)$',
-            r'test_.*\.py$',
-            r'.*_test\.py$'
-        ]
+        # A null byte near the start catches nearly all binaries cheaply
+        if sample.find(b'\x00', 0, 1024) != -1:
+            return True
         
-        for pattern in test_patterns:
-            if re.search(pattern, file_path, re.IGNORECASE):
+        # Count non-text bytes in 1KB chunks, bailing out as soon as the ratio is decided
+        non_printable = 0
+        total = len(sample)
+        for start in range(0, total, 1024):
+            chunk = sample[start:start + 1024]
+            if b'\x00' in chunk:
+                return True
+            non_printable += len(chunk.translate(None, _TEXT_BYTES))
+            # More than 30% non-text already, whatever the rest of the sample holds
+            if non_printable * 10 > 3 * total:
                 return True
+            # Even if every remaining byte were non-text the ratio would stay within 30%
+            if (non_printable + total - start - len(chunk)) * 10 <= 3 * total:
+                return False
+        
         return False
     
     async def add_pull_request_comments(
@@ -424,10 +687,17 @@ class AzureDevOpsClient:
         repository_id: str,
         pull_request_id: int,
         comments: List[Dict[str, Any]]
-    ) -> List[CommentThread]:
-        """Add comments to a pull request"""
+    ) -> Dict[str, Any]:
+        """Add comments to a pull request
+        
+        Returns:
+            Dict with the created "threads" and an "errors" message for each thread that
+            failed to post; raises if no thread could be posted at all
+        """
         try:
-            threads_created = []
+            thread_posts = []
+            # Threads are independent, so they are posted concurrently within the fetch limit
+            post_limit = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
             
             for comment_data in comments:
                 # Create comment
@@ -457,19 +727,36 @@ class AzureDevOpsClient:
                 )
                 
                 # Post the thread
-                created_thread = self.git_client.create_thread(
+                thread_posts.append(self._run_limited(
+                    post_limit,
+                    self.git_client.create_thread,
                     comment_thread=thread,
                     repository_id=repository_id,
                     pull_request_id=pull_request_id,
                     project=project
-                )
-                threads_created.append(created_thread)
+                ))
+            
+            # Posts are not rolled back, so one failure must not hide the threads that were created
+            results = await asyncio.gather(*thread_posts, return_exceptions=True)
+            threads_created = [result for result in results if not isinstance(result, Exception)]
+            failures = [result for result in results if isinstance(result, Exception)]
+            
+            if failures and not threads_created:
+                raise failures[0]
+            for failure in failures:
+                logger.warning(f"Could not post a comment to PR #{pull_request_id}: {failure}")
             
-            logger.info(f"Posted {len(threads_created)} comments to PR #{pull_request_id}")
-            return threads_created
+            logger.info(f"Posted {len(threads_created)} of {len(comments)} comments to PR #{pull_request_id}")
+            return {
+                "threads": threads_created,
+                "errors": [f"Failed to post comment: {failure}" for failure in failures]
+            }
         except Exception as e:
             logger.error(f"Error adding comments: {e}")
             raise
+        finally:
+            # Some threads may have been created even if others failed
+            self._invalidate_pull_request(project, repository_id, pull_request_id)
     
     async def post_review_to_azure(
         self,
@@ -546,11 +833,12 @@ class AzureDevOpsClient:
                     comments_to_post.append(comment_data)
                 
                 try:
-                    threads = await self.add_pull_request_comments(
+                    posted = await self.add_pull_request_comments(
                         organization, project, repository_id, 
                         pull_request_id, comments_to_post
                     )
-                    result["comments_posted"] = len(threads)
+                    result["comments_posted"] = len(posted["threads"])
+                    result["errors"].extend(posted["errors"])
                 except Exception as e:
                     result["errors"].append(f"Failed to post comments: {e}")
             
@@ -591,6 +879,8 @@ class AzureDevOpsClient:
         except Exception as e:
             logger.error(f"Error posting review to Azure: {e}")
             raise
+        finally:
+            self._invalidate_pull_request(project, repository_id, pull_request_id)
     
     def _format_review_comment(self, comment: Dict[str, Any]) -> str:
         """Format a single review comment for Azure DevOps"""
@@ -816,6 +1106,8 @@ class AzureDevOpsClient:
         except Exception as e:
             logger.error(f"Error updating vote: {e}")
             raise
+        finally:
+            self._invalidate_pull_request(project, repository_id, pull_request_id)
     
     async def approve_pull_request(
         self,
@@ -839,6 +1131,8 @@ class AzureDevOpsClient:
                 pull_request_id, review_data
             )
             
+            # Re-read the PR so the caller sees the reviewer votes after the approval
+            self._invalidate_pull_request(project, repository_id, pull_request_id)
             pr = await self.get_pull_request(
                 organization, project, repository_id, pull_request_id
             )
@@ -3,7 +3,7 @@
 import logging
 import os
 import json
-import xml.etree.ElementTree as ET
+from itertools import islice, zip_longest
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
@@ -12,6 +12,23 @@ from .security_detector import SecurityDetector
 
 logger = logging.getLogger(__name__)
 
+# Prompt file text keyed by path, with the (mtime, size) fingerprint it was read at
+_prompt_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def _read_prompt_file(path: str) -> str:
+    """Read a prompt file, reusing the cached text while the file is unchanged"""
+    stat = os.stat(path)
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+    cached = _prompt_cache.get(path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    
+    with open(path, 'r') as f:
+        content = f.read()
+    _prompt_cache[path] = (fingerprint, content)
+    return content
+
 
 @dataclass
 class ReviewData:
@@ -90,10 +107,8 @@ class CodeReviewer:
         if not file_types:
             return self._get_prompt_for_type(FileType.DEFAULT)
         
-        # If mixed review needed, combine prompts
-        if self.file_detector.should_use_mixed_review(
-            [{"path": path} for paths in file_types.values() for path in paths]
-        ):
+        # If mixed review needed, combine prompts (file types are already grouped, so don't re-detect them)
+        if self.file_detector.has_mixed_file_types(file_types):
             return self._get_combined_prompt(file_types)
         
         # Use dominant file type prompt
@@ -106,10 +121,9 @@ class CodeReviewer:
         # Check if custom prompt file is specified
         if self.settings.custom_review_prompt_file:
             try:
-                with open(self.settings.custom_review_prompt_file, 'r') as f:
-                    custom_prompt = f.read()
-                    logger.info(f"Using custom review prompt from {self.settings.custom_review_prompt_file}")
-                    return custom_prompt
+                custom_prompt = _read_prompt_file(self.settings.custom_review_prompt_file)
+                logger.info(f"Using custom review prompt from {self.settings.custom_review_prompt_file}")
+                return custom_prompt
             except Exception as e:
                 logger.warning(f"Failed to load custom prompt file: {e}, using file-type specific prompt")
         
@@ -123,9 +137,9 @@ class CodeReviewer:
         
         if os.path.exists(prompt_path):
             try:
-                with open(prompt_path, 'r') as f:
-                    logger.info(f"Using {file_type.value} specific prompt from {prompt_file}")
-                    return f.read()
+                prompt = _read_prompt_file(prompt_path)
+                logger.info(f"Using {file_type.value} specific prompt from {prompt_file}")
+                return prompt
             except Exception as e:
                 logger.warning(f"Failed to load prompt file {prompt_file}: {e}")
         
@@ -444,17 +458,17 @@ Provide your review in JSON format:
         diff_lines = []
         max_lines = max(len(old_lines), len(new_lines))
         
-        for i in range(min(max_lines, 500)):  # Limit to 500 lines
-            if i < len(old_lines) and i < len(new_lines):
-                if old_lines[i] != new_lines[i]:
-                    diff_lines.append(f"- {old_lines[i]}")
-                    diff_lines.append(f"+ {new_lines[i]}")
-                else:
-                    diff_lines.append(f"  {old_lines[i]}")
-            elif i < len(old_lines):
-                diff_lines.append(f"- {old_lines[i]}")
-            elif i < len(new_lines):
-                diff_lines.append(f"+ {new_lines[i]}")
+        # Walk only the first 500 line pairs; the rest of the file is never compared
+        for old_line, new_line in islice(zip_longest(old_lines, new_lines), 500):  # Limit to 500 lines
+            if old_line is None:
+                diff_lines.append(f"+ {new_line}")
+            elif new_line is None:
+                diff_lines.append(f"- {old_line}")
+            elif old_line != new_line:
+                diff_lines.append(f"- {old_line}")
+                diff_lines.append(f"+ {new_line}")
+            else:
+                diff_lines.append(f"  {old_line}")
         
         if max_lines > 500:
             diff_lines.append("... (diff truncated)")
@@ -531,6 +545,7 @@ Provide your review in JSON format:
             elif file_path.endswith(".csproj") or file_path.endswith("packages.config"):
                 # Parse NuGet packages
                 try:
+                    import xml.etree.ElementTree as ET
                     tree = ET.fromstring(content)
                     
                     # Handle .csproj files
@@ -621,16 +636,16 @@ Provide your review in JSON format:
         """
         all_security_issues = []
         
+        files = []
         for change in changes:
-            file_path = change.get("path", "")
             content = change.get("new_content", "") or change.get("full_content", "")
-            
-            if not content:
-                continue
-            
-            # Run security analysis on the file
-            file_issues = self.security_detector.analyze_file_security(file_path, content)
-            
+            if content:
+                files.append((change.get("path", ""), content))
+        
+        # Run security analysis on all files in one batch (scanned serially, unchanged files come from the cache)
+        results = self.security_detector.analyze_files_security(files)
+        
+        for (file_path, _), file_issues in zip(files, results):
             # Add all issues to the list
             all_security_issues.extend(file_issues)
             
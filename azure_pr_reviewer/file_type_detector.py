@@ -1,5 +1,6 @@
 """File type detection and prompt selection system"""
 
+import functools
 import os
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
@@ -124,6 +125,22 @@ class FileTypeDetector:
         ]
     }
     
+    # File types that need their own review approach (excluding config, markdown, etc.)
+    SIGNIFICANT_TYPES = (
+        FileType.CSHARP, FileType.RAZOR_VIEW, FileType.JAVASCRIPT,
+        FileType.TYPESCRIPT, FileType.SQL, FileType.TEST_CSHARP,
+        FileType.TEST_JAVASCRIPT
+    )
+    
+    # All test patterns fused into one case-insensitive regex so each path is scanned once
+    _TEST_FILE_RE = re.compile(
+        '|'.join(f'(?:{pattern})' for patterns in TEST_PATTERNS.values() for pattern in patterns),
+        re.IGNORECASE
+    )
+    
+    # Package file names keyed in lower case for a single dict lookup
+    _PACKAGE_FILES_LOWER = {name.lower(): file_type for name, file_type in PACKAGE_FILES.items()}
+    
     @classmethod
     def detect_file_type(cls, file_path: str, content: Optional[str] = None) -> FileType:
         """
@@ -136,46 +153,47 @@ class FileTypeDetector:
         Returns:
             FileType enum value
         """
+        file_type = cls._detect_file_type_from_path(file_path)
+        
+        # Special handling for Razor views with embedded JavaScript
+        if file_type == FileType.RAZOR_VIEW and content:
+            if cls._has_significant_javascript(content):
+                return FileType.RAZOR_VIEW  # Keep as Razor but we'll handle JS in the prompt
+        
+        # Special case for package.json that might be named differently
+        if file_type == FileType.JSON and 'dependencies' in (content or ''):
+            return FileType.PACKAGE_JAVASCRIPT
+        
+        return file_type
+    
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _detect_file_type_from_path(cls, file_path: str) -> FileType:
+        """Detect the file type from the path alone; cached since PRs classify the same paths repeatedly"""
         # Normalize path
         file_path = file_path.replace('\\', '/')
         file_name = os.path.basename(file_path).lower()
         
         # Check package management files first (highest priority)
-        # Try exact match first
-        if file_name in cls.PACKAGE_FILES:
-            return cls.PACKAGE_FILES[file_name]
-        
-        # Try case-insensitive match for some files
-        for pkg_file, pkg_type in cls.PACKAGE_FILES.items():
-            if file_name.lower() == pkg_file.lower():
-                return pkg_type
+        pkg_type = cls._PACKAGE_FILES_LOWER.get(file_name)
+        if pkg_type is not None:
+            return pkg_type
         
         # Check for .csproj files (C# package files)
-        if file_name.endswith('.csproj') or file_name.endswith('.vbproj') or file_name.endswith('.fsproj'):
+        if file_name.endswith(('.csproj', '.vbproj', '.fsproj')):
             return FileType.PACKAGE_CSHARP
         
         # Check if it's a test file
         if cls._is_test_file(file_path):
             if file_path.endswith('.cs'):
                 return FileType.TEST_CSHARP
-            elif any(file_path.endswith(ext) for ext in ['.js', '.jsx', '.ts', '.tsx']):
+            elif file_path.endswith(('.js', '.jsx', '.ts', '.tsx')):
                 return FileType.TEST_JAVASCRIPT
         
         # Check file extension
         _, ext = os.path.splitext(file_name)
         if ext in cls.EXTENSION_MAP:
-            file_type = cls.EXTENSION_MAP[ext]
-            
-            # Special handling for Razor views with embedded JavaScript
-            if file_type == FileType.RAZOR_VIEW and content:
-                if cls._has_significant_javascript(content):
-                    return FileType.RAZOR_VIEW  # Keep as Razor but we'll handle JS in the prompt
-            
-            # Special case for package.json that might be named differently
-            if file_type == FileType.JSON and 'dependencies' in (content or ''):
-                return FileType.PACKAGE_JAVASCRIPT
-            
-            return file_type
+            return cls.EXTENSION_MAP[ext]
         
         # Check for specific file names
         if file_name in ['dockerfile', 'containerfile']:
@@ -191,17 +209,7 @@ class FileTypeDetector:
     @classmethod
     def _is_test_file(cls, file_path: str) -> bool:
         """Check if a file is a test file based on naming patterns"""
-        # Check C# test patterns
-        for pattern in cls.TEST_PATTERNS['csharp']:
-            if re.search(pattern, file_path, re.IGNORECASE):
-                return True
-        
-        # Check JavaScript/TypeScript test patterns
-        for pattern in cls.TEST_PATTERNS['javascript']:
-            if re.search(pattern, file_path, re.IGNORECASE):
-                return True
-        
-        return False
+        return cls._TEST_FILE_RE.search(file_path) is not None
     
     @classmethod
     def _has_significant_javascript(cls, content: str) -> bool:
@@ -332,18 +340,14 @@ class FileTypeDetector:
         Returns:
             True if PR contains multiple significant file types
         """
-        file_groups = cls.analyze_pr_files(changes)
-        
-        # Count significant file types (excluding config, markdown, etc.)
-        significant_types = [
-            FileType.CSHARP, FileType.RAZOR_VIEW, FileType.JAVASCRIPT,
-            FileType.TYPESCRIPT, FileType.SQL, FileType.TEST_CSHARP,
-            FileType.TEST_JAVASCRIPT
-        ]
-        
+        return cls.has_mixed_file_types(cls.analyze_pr_files(changes))
+    
+    @classmethod
+    def has_mixed_file_types(cls, file_groups: Dict[FileType, List[str]]) -> bool:
+        """Check already grouped files for more than one significant file type"""
         significant_count = sum(
-            1 for ft in significant_types 
+            1 for ft in cls.SIGNIFICANT_TYPES
             if ft in file_groups and len(file_groups[ft]) > 0
         )
         
-        return significant_count > 1
\ No newline at end of file
+        return significant_count > 1
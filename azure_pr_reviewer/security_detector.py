@@ -1,11 +1,43 @@
 """Comprehensive security detector for all file types"""
 
 import re
+import hashlib
 import logging
-from typing import List, Dict, Any, Tuple
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of (file, content) results kept by a detector instance
+MAX_CACHED_RESULTS = 1024
+
+# Regexes used by the per-line checks, compiled once at import
+SENSITIVE_INTERPOLATION_RE = re.compile(r'[\+\$\{].*\b(password|pwd|passwd|secret|token|apikey|api_key|connstr|connectionstring|accesstoken)\b')
+SENSITIVE_VARIABLE_RE = re.compile(r'\b(password|pwd|passwd|secret|token|apikey|api_key|connstr|connectionstring|accesstoken|userpassword)\b')
+# Safe messages like "Authentication completed" or "User authorized"
+SAFE_LOG_MESSAGE_RE = re.compile(
+    r'authentication\s+(completed|successful|failed)'
+    r'|user\s+(authorized|authenticated|logged\s+in\s+successfully)'
+    r'|login\s+(successful|failed|attempt)'
+    r'|successfully'
+    r'|completed'
+)
+CONFIG_VALUE_RE = re.compile(r'["\']\s*[a-zA-Z0-9+/=]{20,}\s*["\']')
+BASE64_SECRET_RE = re.compile(r'["\'][A-Za-z0-9+/]{40,}={0,2}["\']')
+ENVIRONMENT_ACCESS_RE = re.compile(r'environment\.(get|getenv|getenvironmentvariable)')
+SQL_CREDENTIAL_RE = re.compile(r'(password|secret)\s*=')
+
+# Comment prefixes per file extension group, checked with a single str.startswith call
+COMMENT_PREFIXES = (
+    (('.cs', '.java', '.js', '.ts', '.tsx', '.jsx'), ('//', '/*', '*')),  # C#, Java, JavaScript, TypeScript
+    (('.py',), ('#',)),  # Python
+    (('.sql',), ('--', '/*')),  # SQL
+    (('.html', '.xml', '.xaml'), ('<!--',)),  # HTML/XML
+    (('.css',), ('/*',)),  # CSS
+    (('.sh', '.bash'), ('#',)),  # Shell scripts
+)
+
 class SecurityDetector:
     """Detects security issues across all file types"""
     
@@ -65,6 +97,25 @@ class SecurityDetector:
             (r'-----BEGIN', 'Certificate or key block detected'),
             (r'MII[A-Za-z0-9+/]{20,}', 'Base64 encoded certificate'),
         ]
+        
+        # Compile every pattern group once, tagged with the label used in issue messages
+        self._compiled_pattern_groups = [
+            (self._compile_patterns(self.password_exposure_patterns), "PASSWORD EXPOSURE"),
+            (self._compile_patterns(self.connection_string_patterns), "CONNECTION STRING LEAK"),
+            (self._compile_patterns(self.token_patterns), "TOKEN LEAK"),
+            (self._compile_patterns(self.cloud_secrets_patterns), "CLOUD SECRET LEAK"),
+            (self._compile_patterns(self.certificate_patterns), "CERTIFICATE LEAK"),
+        ]
+        
+        # Results keyed by (file path, content digest) so unchanged files are not rescanned
+        self._results_cache: "OrderedDict[Tuple[str, bytes], List[Dict[str, Any]]]" = OrderedDict()
+        # Callers may share one detector across threads (e.g. asyncio.to_thread)
+        self._results_lock = threading.Lock()
+    
+    @staticmethod
+    def _compile_patterns(patterns: List[Tuple[str, str]]) -> List[Tuple[re.Pattern, str]]:
+        """Compile (pattern, description) pairs for case-insensitive matching"""
+        return [(re.compile(pattern, re.IGNORECASE), description) for pattern, description in patterns]
     
     def analyze_file_security(self, file_path: str, content: str) -> List[Dict[str, Any]]:
         """Analyze file for security issues - ONE consolidated comment per line"""
@@ -72,18 +123,61 @@ class SecurityDetector:
         if not content:
             return []
         
+        # Reuse the result for identical content (e.g. the same PR reviewed again)
+        cache_key = self._cache_key(file_path, content)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
+        issues = self._scan_content(file_path, content)
+        self._store_cached(cache_key, issues)
+        return issues
+    
+    def analyze_files_security(self, files: List[Tuple[str, str]]) -> List[List[Dict[str, Any]]]:
+        """Analyze several (file_path, content) pairs one after another, returning issues for each in order"""
+        return [self.analyze_file_security(file_path, content) for file_path, content in files]
+    
+    @staticmethod
+    def _cache_key(file_path: str, content: str) -> Tuple[str, bytes]:
+        """Build the results cache key from the path and a digest of the content"""
+        return (file_path, hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest())
+    
+    def _get_cached(self, cache_key: Tuple[str, bytes]) -> Optional[List[Dict[str, Any]]]:
+        """Return a copy of cached issues, or None on a miss"""
+        with self._results_lock:
+            cached = self._results_cache.get(cache_key)
+            if cached is None:
+                return None
+            self._results_cache.move_to_end(cache_key)
+        return [dict(issue) for issue in cached]
+    
+    def _store_cached(self, cache_key: Tuple[str, bytes], issues: List[Dict[str, Any]]):
+        """Cache a copy of the issues, evicting the least recently used entry when full"""
+        stored = [dict(issue) for issue in issues]
+        with self._results_lock:
+            self._results_cache[cache_key] = stored
+            self._results_cache.move_to_end(cache_key)
+            if len(self._results_cache) > MAX_CACHED_RESULTS:
+                self._results_cache.popitem(last=False)
+    
+    def _scan_content(self, file_path: str, content: str) -> List[Dict[str, Any]]:
+        """Scan every line of a file and consolidate issues per line"""
+        
         # Group ALL issues by line number to consolidate
         from collections import defaultdict
         issues_by_line = defaultdict(list)
         lines = content.split('\n')
         
+        # Resolve comment prefixes once per file rather than once per line
+        comment_prefixes = self._get_comment_prefixes(file_path)
+        
         # Check each line for ALL security issues
         for line_num, line in enumerate(lines, 1):
             line_lower = line.lower()
             line_stripped = line.strip()
             
             # Skip empty lines and comments
-            if not line_stripped or self._is_comment_line(line_stripped, file_path):
+            if not line_stripped or (comment_prefixes and line_stripped.startswith(comment_prefixes)):
                 continue
             
             # Collect ALL security issues for this line
@@ -105,35 +199,12 @@ class SecurityDetector:
             if 'tostring' in line_lower and ('override' in line_lower or 'public' in line_lower) and self._contains_password_in_method(lines, line_num):
                 line_issues.append("CRITICAL: ToString method exposes password information")
             
-            # 5. Check all password exposure patterns
-            for pattern, description in self.password_exposure_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    if not self._is_duplicate_issue(description, line_issues):
-                        line_issues.append(f"PASSWORD EXPOSURE: {description}")
-            
-            # 6. Check connection string patterns
-            for pattern, description in self.connection_string_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    if not self._is_duplicate_issue(description, line_issues):
-                        line_issues.append(f"CONNECTION STRING LEAK: {description}")
-            
-            # 7. Check token/API key patterns
-            for pattern, description in self.token_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    if not self._is_duplicate_issue(description, line_issues):
-                        line_issues.append(f"TOKEN LEAK: {description}")
-            
-            # 8. Check cloud service secrets
-            for pattern, description in self.cloud_secrets_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    if not self._is_duplicate_issue(description, line_issues):
-                        line_issues.append(f"CLOUD SECRET LEAK: {description}")
-            
-            # 9. Check certificate patterns
-            for pattern, description in self.certificate_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    if not self._is_duplicate_issue(description, line_issues):
-                        line_issues.append(f"CERTIFICATE LEAK: {description}")
+            # 5-9. Check password exposure, connection string, token, cloud secret and certificate patterns
+            for compiled_patterns, label in self._compiled_pattern_groups:
+                for pattern, description in compiled_patterns:
+                    if pattern.search(line):
+                        if not self._is_duplicate_issue(description, line_issues):
+                            line_issues.append(f"{label}: {description}")
             
             # 10. Additional context-specific checks
             line_issues.extend(self._check_context_specific_issues(line, line_lower, file_path))
@@ -157,36 +228,12 @@ class SecurityDetector:
         # Return ONE issue per line (consolidated)
         return list(issues_by_line.values())
     
-    def _is_comment_line(self, line: str, file_path: str) -> bool:
-        """Check if line is a comment based on file type"""
-        
-        line = line.strip()
-        
-        # C#, Java, JavaScript, TypeScript comments
-        if file_path.endswith(('.cs', '.java', '.js', '.ts', '.tsx', '.jsx')):
-            return line.startswith('//') or line.startswith('/*') or line.startswith('*')
-        
-        # Python comments
-        elif file_path.endswith('.py'):
-            return line.startswith('#')
-        
-        # SQL comments
-        elif file_path.endswith('.sql'):
-            return line.startswith('--') or line.startswith('/*')
-        
-        # HTML/XML comments
-        elif file_path.endswith(('.html', '.xml', '.xaml')):
-            return line.startswith('<!--')
-        
-        # CSS comments
-        elif file_path.endswith('.css'):
-            return line.startswith('/*')
-        
-        # Shell script comments
-        elif file_path.endswith(('.sh', '.bash')):
-            return line.startswith('#')
-        
-        return False
+    def _get_comment_prefixes(self, file_path: str) -> Tuple[str, ...]:
+        """Get the comment prefixes for a file based on its extension"""
+        for extensions, prefixes in COMMENT_PREFIXES:
+            if file_path.endswith(extensions):
+                return prefixes
+        return ()
     
     def _contains_password_in_method(self, lines: List[str], method_start: int) -> bool:
         """Check if a method contains password in its body"""
@@ -224,22 +271,14 @@ class SecurityDetector:
         # Look for patterns that indicate actual sensitive values being logged
         
         # Check for concatenation or interpolation with sensitive variables
-        if re.search(r'[\+\$\{].*\b(password|pwd|passwd|secret|token|apikey|api_key|connstr|connectionstring|accesstoken)\b', line_lower):
+        if SENSITIVE_INTERPOLATION_RE.search(line_lower):
             return True
         
         # Check for sensitive variables being passed as parameters
-        if re.search(r'\b(password|pwd|passwd|secret|token|apikey|api_key|connstr|connectionstring|accesstoken|userpassword)\b', line_lower):
+        if SENSITIVE_VARIABLE_RE.search(line_lower):
             # But exclude safe messages like "Authentication completed" or "User authorized"
-            safe_patterns = [
-                r'authentication\s+(completed|successful|failed)',
-                r'user\s+(authorized|authenticated|logged\s+in\s+successfully)',
-                r'login\s+(successful|failed|attempt)',
-                r'successfully',
-                r'completed'
-            ]
-            for safe in safe_patterns:
-                if re.search(safe, line_lower):
-                    return False
+            if SAFE_LOG_MESSAGE_RE.search(line_lower):
+                return False
             
             # If it contains quotes and a sensitive word, it's likely logging the value
             if '"' in line and any(word in line_lower for word in ['password:', 'token:', 'secret:', 'with password', 'connection string:']):
@@ -268,19 +307,19 @@ class SecurityDetector:
         # Configuration files specific checks
         if file_path.endswith(('.config', '.xml', '.json', '.yaml', '.yml', '.properties', '.env')):
             # Check for sensitive values in config files
-            if re.search(r'["\']\s*[a-zA-Z0-9+/=]{20,}\s*["\']', line):
+            if CONFIG_VALUE_RE.search(line):
                 if any(word in line_lower for word in ['password', 'secret', 'key', 'token']):
                     issues.append("CONFIGURATION LEAK: Sensitive value in configuration file")
         
         # Code files specific checks
         if file_path.endswith(('.cs', '.java', '.js', '.ts', '.py', '.php')):
             # Check for base64 encoded secrets
-            if re.search(r'["\'][A-Za-z0-9+/]{40,}={0,2}["\']', line):
+            if BASE64_SECRET_RE.search(line):
                 if any(word in line_lower for word in ['secret', 'key', 'token', 'password']):
                     issues.append("ENCODED SECRET: Base64 encoded secret detected")
             
             # Check for environment variable exposure
-            if re.search(r'environment\.(get|getenv|getenvironmentvariable)', line_lower):
+            if ENVIRONMENT_ACCESS_RE.search(line_lower):
                 if any(word in line_lower for word in ['password', 'secret', 'key', 'token']):
                     # This is actually good practice, but flag if it's being logged
                     if self._is_logging_statement(line_lower):
@@ -288,7 +327,7 @@ class SecurityDetector:
         
         # SQL files specific checks
         if file_path.endswith(('.sql', '.ddl')):
-            if re.search(r'(password|secret)\s*=', line_lower):
+            if SQL_CREDENTIAL_RE.search(line_lower):
                 issues.append("SQL CREDENTIAL: Password or secret in SQL file")
         
         return issues
@@ -333,4 +372,4 @@ def analyze_pr_security(changes: List[Dict[str, Any]]) -> Tuple[List[Dict[str, A
     
     recommendations = detector.get_security_recommendations(all_issues)
     
-    return all_issues, recommendations
\ No newline at end of file
+    return all_issues, recommendations
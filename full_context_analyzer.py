@@ -1,21 +1,42 @@
 """Full context analyzer that clones repository for complete analysis"""
 
 import os
+import re
 import shutil
 import tempfile
+import threading
+import uuid
 import asyncio
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pathlib import Path
 import subprocess
 
 from azure_pr_reviewer.config import Settings
-from azure_pr_reviewer.azure_client import AzureDevOpsClient
+from azure_pr_reviewer.azure_client import AzureDevOpsClient, BINARY_FILE_RE
 from azure_pr_reviewer.security_detector import SecurityDetector
 from package_vulnerability_analyzer import PackageVulnerabilityAnalyzer, VulnerabilityReport
 
 logger = logging.getLogger(__name__)
 
+# Manifests the package analysis reads, kept in every sparse checkout
+PACKAGE_MANIFEST_PATTERNS = [
+    "package.json", "package-lock.json", "yarn.lock",
+    "*.csproj", "*.fsproj", "*.vbproj", "packages.config", "*.props",
+    "requirements*.txt", "Pipfile", "Pipfile.lock", "setup.py", "pyproject.toml",
+    "pom.xml",
+    "composer.json", "composer.lock"
+]
+
+# Changed files larger than this are generated or data files and are not read for scanning
+MAX_SCAN_BYTES = 2 * 1024 * 1024
+
+# Returned by _read_file in place of the content of a file over MAX_SCAN_BYTES
+_TOO_LARGE = object()
+
+# Characters with a special meaning in sparse-checkout (gitignore-style) patterns
+_SPARSE_SPECIAL_RE = re.compile(r'([\\*?\[!#])')
+
 
 class FullContextAnalyzer:
     """Analyzer that clones full repository for complete context analysis"""
@@ -27,13 +48,18 @@ class FullContextAnalyzer:
         self.working_dir = Path(settings.working_directory)
         self.auto_cleanup = settings.auto_cleanup
         self.package_analyzer = None  # Will be initialized when needed
+        self._removal_threads: List[threading.Thread] = []
         
     def _ensure_working_directory(self):
         """Ensure working directory exists and is clean - ALWAYS clean before starting"""
+        # Remove leftovers of earlier runs that were interrupted mid-delete
+        for stale in self.working_dir.parent.glob(f"{self.working_dir.name}.trash-*"):
+            self._remove_in_background(stale)
+        
         # ALWAYS clean before starting a new analysis
         if self.working_dir.exists():
             print(f"Cleaning existing working directory: {self.working_dir}")
-            shutil.rmtree(self.working_dir, ignore_errors=True)
+            self._remove_in_background(self.working_dir)
         
         self.working_dir.mkdir(parents=True, exist_ok=True)
         print(f"Working directory ready: {self.working_dir}")
@@ -43,15 +69,38 @@ class FullContextAnalyzer:
         if self.auto_cleanup and self.working_dir.exists():
             print(f"Cleaning up working directory: {self.working_dir}")
             shutil.rmtree(self.working_dir, ignore_errors=True)
+        self._wait_for_removals()
+            
+    def _remove_in_background(self, path: Path):
+        """Move a directory out of the way and delete it while the clone proceeds"""
+        trash = path if ".trash-" in path.name else path.with_name(f"{path.name}.trash-{uuid.uuid4().hex}")
+        try:
+            if trash != path:
+                os.rename(path, trash)
+        except OSError as e:
+            # Rename can fail (e.g. files held open on Windows); delete in place instead
+            logger.warning(f"Could not move {path} aside, removing synchronously: {e}")
+            shutil.rmtree(path, ignore_errors=True)
+            return
+        # Not a daemon thread, so the interpreter waits for the delete to finish before exiting
+        thread = threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={'ignore_errors': True})
+        thread.start()
+        self._removal_threads.append(thread)
+        
+    def _wait_for_removals(self):
+        """Block until background deletes started by this analyzer have finished"""
+        while self._removal_threads:
+            self._removal_threads.pop().join()
             
     async def clone_repository(
         self,
         organization: str,
         project: str,
         repository: str,
-        branch: str = "main"
+        branch: str = "main",
+        sparse_paths: Optional[List[str]] = None
     ) -> Path:
-        """Clone repository to working directory"""
+        """Clone repository to working directory, limited to sparse_paths and manifests if given"""
         
         # Clean/create working directory
         self._ensure_working_directory()
@@ -65,9 +114,14 @@ class FullContextAnalyzer:
             print(f"  Branch: {branch}")
             print(f"  Target: {repo_path}")
             
-            # Clone the repository
+            # Clone the repository. Blobless (partial) clone: only commits and trees are transferred
+            # up front and file contents are fetched when checked out; servers without filter
+            # support ignore the option and send a normal shallow clone
+            clone_args = ["git", "clone", "--filter=blob:none", "-b", branch, "--depth", "1"]
+            if sparse_paths is not None:
+                clone_args.append("--no-checkout")
             result = subprocess.run(
-                ["git", "clone", "-b", branch, "--depth", "1", clone_url, str(repo_path)],
+                clone_args + [clone_url, str(repo_path)],
                 capture_output=True,
                 text=True,
                 timeout=60
@@ -77,6 +131,9 @@ class FullContextAnalyzer:
                 logger.error(f"Clone failed: {result.stderr}")
                 raise Exception(f"Failed to clone repository: {result.stderr}")
                 
+            if sparse_paths is not None:
+                self._sparse_checkout(repo_path, branch, sparse_paths)
+                
             print(f"Repository cloned successfully to {repo_path}")
             return repo_path
             
@@ -87,6 +144,41 @@ class FullContextAnalyzer:
             logger.error(f"Clone error: {e}")
             raise
     
+    def _sparse_checkout(self, repo_path: Path, branch: str, sparse_paths: List[str]):
+        """Materialize only the given files plus package manifests in the working tree"""
+        # Anchor each changed file at the repository root; manifests match at any depth
+        patterns = ['/' + _SPARSE_SPECIAL_RE.sub(r'\\\1', path.lstrip('/')) for path in sparse_paths]
+        patterns.extend(PACKAGE_MANIFEST_PATTERNS)
+        
+        # With a blobless clone this can already fetch blobs from the remote
+        try:
+            result = subprocess.run(
+                ["git", "sparse-checkout", "set", "--no-cone", "--stdin"],
+                cwd=repo_path,
+                input="\n".join(patterns) + "\n",
+                capture_output=True,
+                text=True,
+                timeout=60
+            )
+        except subprocess.TimeoutExpired:
+            logger.error("Sparse checkout timed out")
+            raise Exception("Sparse checkout timed out")
+        if result.returncode != 0:
+            # Older git without sparse-checkout: fall back to the full tree
+            logger.warning(f"Sparse checkout unavailable, checking out full tree: {result.stderr}")
+            
+        result = subprocess.run(
+            ["git", "checkout", branch],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+        if result.returncode != 0:
+            logger.error(f"Checkout failed: {result.stderr}")
+            raise Exception(f"Failed to check out {branch}: {result.stderr}")
+        print(f"Sparse checkout of {len(sparse_paths)} changed files and package manifests")
+            
     async def analyze_packages(self, repo_path: Path) -> VulnerabilityReport:
         """Analyze all packages in the repository for vulnerabilities"""
         
@@ -146,6 +238,17 @@ class FullContextAnalyzer:
             logger.error(f"Checkout error: {e}")
             raise
             
+    def _read_file(self, full_path: Path):
+        """Read an entire file as text; None if it does not exist, _TOO_LARGE if over the limit"""
+        try:
+            size = full_path.stat().st_size
+        except FileNotFoundError:
+            return None
+        if size > MAX_SCAN_BYTES:
+            return _TOO_LARGE
+        with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read()
+            
     async def analyze_full_repository(
         self,
         repo_path: Path,
@@ -158,38 +261,46 @@ class FullContextAnalyzer:
         
         print(f"\nAnalyzing {len(changed_files)} changed files with full context...")
         
+        # Binary files have nothing for the security patterns to match, so they are never read
+        text_files = []
         for file_path in changed_files:
-            # Get full file path
-            full_path = repo_path / file_path.lstrip('/')
-            
-            if not full_path.exists():
+            if BINARY_FILE_RE.search(file_path):
+                print(f"  Skipping binary file: {file_path}")
+            else:
+                text_files.append(file_path)
+        
+        # Read all changed files concurrently, then scan them as one batch
+        full_paths = [repo_path / file_path.lstrip('/') for file_path in text_files]
+        contents = await asyncio.gather(
+            *(asyncio.to_thread(self._read_file, full_path) for full_path in full_paths),
+            return_exceptions=True
+        )
+        
+        files_to_scan = []
+        for file_path, content in zip(text_files, contents):
+            if content is None:
                 print(f"  File not found: {file_path}")
-                continue
-                
-            try:
-                # Read entire file content
-                with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                print(f"  Analyzing: {file_path} ({len(content)} chars)")
-                
-                # Analyze entire file for security issues
-                security_issues = self.security_detector.analyze_file_security(
-                    file_path,
-                    content
-                )
-                
-                if security_issues:
-                    print(f"    Found {len(security_issues)} security issues:")
-                    for issue in security_issues[:3]:  # Show first 3
-                        print(f"      - Line {issue['line_number']}: {issue['content'][:60]}...")
-                    all_issues.extend(security_issues)
-                    
-                analyzed_files += 1
+            elif content is _TOO_LARGE:
+                print(f"  Skipping large file: {file_path} (over {MAX_SCAN_BYTES} bytes)")
+            elif isinstance(content, Exception):
+                logger.error(f"Error analyzing {file_path}: {content}")
+                print(f"    Error: {content}")
+            else:
+                files_to_scan.append((file_path, content))
+        
+        # Analyze entire files for security issues
+        results = await asyncio.to_thread(self.security_detector.analyze_files_security, files_to_scan)
+        
+        for (file_path, content), security_issues in zip(files_to_scan, results):
+            print(f"  Analyzing: {file_path} ({len(content)} chars)")
+            
+            if security_issues:
+                print(f"    Found {len(security_issues)} security issues:")
+                for issue in security_issues[:3]:  # Show first 3
+                    print(f"      - Line {issue['line_number']}: {issue['content'][:60]}...")
+                all_issues.extend(security_issues)
                 
-            except Exception as e:
-                logger.error(f"Error analyzing {file_path}: {e}")
-                print(f"    Error: {e}")
+            analyzed_files += 1
                 
         print(f"\nAnalysis complete:")
         print(f"  Files analyzed: {analyzed_files}")
@@ -215,42 +326,41 @@ class FullContextAnalyzer:
             print(f"FULL CONTEXT ANALYSIS FOR PR #{pr_id}")
             print(f"{'='*50}")
             
-            # Get PR details
-            pr = await self.azure_client.get_pull_request(
-                organization, project, repository, pr_id
+            # Get PR details and changed files together; the sparse clone needs both
+            pr, changes = await asyncio.gather(
+                self.azure_client.get_pull_request(
+                    organization, project, repository, pr_id
+                ),
+                self.azure_client.get_pull_request_changes(
+                    organization, project, repository, pr_id
+                )
             )
             
             print(f"PR Title: {pr.title}")
             print(f"Source: {pr.source_ref_name}")
             print(f"Target: {pr.target_ref_name}")
             
-            # Get changed files
-            changes = await self.azure_client.get_pull_request_changes(
-                organization, project, repository, pr_id
-            )
-            
             changed_files = [change['path'] for change in changes]
             print(f"Changed files: {len(changed_files)}")
             
             # Clone repository
             target_branch = pr.target_ref_name.replace('refs/heads/', '')
             repo_path = await self.clone_repository(
-                organization, project, repository, target_branch
+                organization, project, repository, target_branch, sparse_paths=changed_files
             )
             
             # Checkout PR branch
             source_branch = pr.source_ref_name.replace('refs/heads/', '')
             await self.checkout_pr_branch(repo_path, source_branch)
             
-            # Analyze with full context
-            analysis_result = await self.analyze_full_repository(
-                repo_path, changed_files
+            # Analyze with full context and analyze packages for vulnerabilities; package
+            # analysis runs on the loop while the changed files are read and scanned in threads
+            print("\nAnalyzing changed files and packages for vulnerabilities...")
+            analysis_result, vulnerability_report = await asyncio.gather(
+                self.analyze_full_repository(repo_path, changed_files),
+                self.analyze_packages(repo_path)
             )
             
-            # Analyze packages for vulnerabilities
-            print("\nAnalyzing packages for vulnerabilities...")
-            vulnerability_report = await self.analyze_packages(repo_path)
-            
             # Add package vulnerabilities to the result
             package_issues = []
             if vulnerability_report.vulnerable_packages > 0:
@@ -266,10 +376,10 @@ class FullContextAnalyzer:
                             })
             
             # Check for critical issues
+            # 'password' also covers 'revealpassword', so one lowered check per issue is enough
             critical_issues = [
                 issue for issue in analysis_result['issues']
-                if 'revealpassword' in issue.get('content', '').lower()
-                or 'password' in issue.get('content', '').lower()
+                if 'password' in issue.get('content', '').lower()
             ]
             
             if critical_issues:
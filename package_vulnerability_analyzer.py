@@ -239,31 +239,39 @@ class PackageVulnerabilityAnalyzer:
             "composer": []
         }
         
+        # Split the patterns once so each file needs a dict lookup and a few prefix/suffix checks
+        exact_names = {}
+        wildcards = []
+        for pkg_type, patterns in package_patterns.items():
+            for pattern in patterns:
+                pattern = pattern.lower()
+                if '*' in pattern:
+                    prefix, suffix = pattern.split('*', 1)
+                    wildcards.append((prefix, suffix, pkg_type))
+                else:
+                    exact_names[pattern] = pkg_type
+        skipped_dirs = {'node_modules', 'vendor', 'bin', 'obj'}
+        
         # Walk through all directories
         for root, dirs, files in os.walk(repo_path):
             # Skip hidden directories and common non-code directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', 'vendor', 'bin', 'obj']]
-            
-            root_path = Path(root)
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in skipped_dirs]
             
             for file in files:
                 file_lower = file.lower()
-                file_path = root_path / file
                 
                 # Check each package type
-                for pkg_type, patterns in package_patterns.items():
-                    for pattern in patterns:
-                        if pattern.startswith('*'):
-                            if file_lower.endswith(pattern[1:]):
-                                found_files[pkg_type].append(file_path)
-                                break
-                        elif pattern.endswith('*'):
-                            if file_lower.startswith(pattern[:-1]):
-                                found_files[pkg_type].append(file_path)
-                                break
-                        elif file_lower == pattern.lower():
-                            found_files[pkg_type].append(file_path)
-                            break
+                pkg_type = exact_names.get(file_lower)
+                if pkg_type is None:
+                    pkg_type = next(
+                        (t for prefix, suffix, t in wildcards
+                         if len(file_lower) >= len(prefix) + len(suffix)
+                         and file_lower.startswith(prefix) and file_lower.endswith(suffix)),
+                        None
+                    )
+                
+                if pkg_type is not None:
+                    found_files[pkg_type].append(Path(root) / file)
         
         return found_files
     
@@ -561,48 +569,53 @@ class PackageVulnerabilityAnalyzer:
     def _print_report_summary(self, report: VulnerabilityReport):
         """Print a summary of the vulnerability report"""
         
-        print(f"\n{'='*60}")
-        print(f"VULNERABILITY REPORT SUMMARY")
-        print(f"{'='*60}")
-        print(f"Scan completed: {report.scan_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print()
+        # Collect the report and write it in one go rather than one console write per line
+        lines = []
         
-        print(f"[STATISTICS]:")
-        print(f"  Total packages analyzed: {report.total_packages}")
-        print(f"  Vulnerable packages: {report.vulnerable_packages}")
-        print(f"  Outdated packages: {report.outdated_packages}")
-        print()
+        lines.append(f"\n{'='*60}")
+        lines.append(f"VULNERABILITY REPORT SUMMARY")
+        lines.append(f"{'='*60}")
+        lines.append(f"Scan completed: {report.scan_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append("")
         
-        print(f"[VULNERABILITIES BY SEVERITY]:")
-        print(f"  Critical: {report.critical_vulnerabilities}")
-        print(f"  High: {report.high_vulnerabilities}")
-        print(f"  Medium: {report.medium_vulnerabilities}")
-        print(f"  Low: {report.low_vulnerabilities}")
-        print()
+        lines.append(f"[STATISTICS]:")
+        lines.append(f"  Total packages analyzed: {report.total_packages}")
+        lines.append(f"  Vulnerable packages: {report.vulnerable_packages}")
+        lines.append(f"  Outdated packages: {report.outdated_packages}")
+        lines.append("")
+        
+        lines.append(f"[VULNERABILITIES BY SEVERITY]:")
+        lines.append(f"  Critical: {report.critical_vulnerabilities}")
+        lines.append(f"  High: {report.high_vulnerabilities}")
+        lines.append(f"  Medium: {report.medium_vulnerabilities}")
+        lines.append(f"  Low: {report.low_vulnerabilities}")
+        lines.append("")
         
         if report.vulnerable_packages > 0:
-            print(f"[VULNERABLE PACKAGES]:")
+            lines.append(f"[VULNERABLE PACKAGES]:")
             for pkg in report.packages:
                 if pkg.is_vulnerable:
-                    print(f"  - {pkg.name}@{pkg.version} ({pkg.package_type})")
+                    lines.append(f"  - {pkg.name}@{pkg.version} ({pkg.package_type})")
                     for vuln in pkg.vulnerabilities[:2]:  # Show first 2
-                        print(f"    • {vuln['cve']}: {vuln['severity'].upper()}")
-            print()
+                        lines.append(f"    • {vuln['cve']}: {vuln['severity'].upper()}")
+            lines.append("")
         
-        print(f"[RECOMMENDATIONS]:")
+        lines.append(f"[RECOMMENDATIONS]:")
         for rec in report.recommendations:
-            print(f"  {rec}")
-        print()
+            lines.append(f"  {rec}")
+        lines.append("")
         
         # Overall risk assessment
         if report.critical_vulnerabilities > 0:
-            print(f"[RISK LEVEL]: CRITICAL - Immediate action required!")
+            lines.append(f"[RISK LEVEL]: CRITICAL - Immediate action required!")
         elif report.high_vulnerabilities > 0:
-            print(f"[RISK LEVEL]: HIGH - Address vulnerabilities soon")
+            lines.append(f"[RISK LEVEL]: HIGH - Address vulnerabilities soon")
         elif report.vulnerable_packages > 0:
-            print(f"[RISK LEVEL]: MEDIUM - Plan updates")
+            lines.append(f"[RISK LEVEL]: MEDIUM - Plan updates")
         else:
-            print(f"[RISK LEVEL]: LOW - No known vulnerabilities")
+            lines.append(f"[RISK LEVEL]: LOW - No known vulnerabilities")
+        
+        print("\n".join(lines))
 
 
 async def analyze_pr_packages(repo_path: Path) -> VulnerabilityReport:
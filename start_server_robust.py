@@ -8,20 +8,15 @@ import os
 import sys
 import json
 from pathlib import Path
+from typing import Optional
 
 # Get the directory where this script is located
 SCRIPT_DIR = Path(__file__).parent.absolute()
-os.chdir(SCRIPT_DIR)
 
-# Add the project directory to Python path
-sys.path.insert(0, str(SCRIPT_DIR))
-
-print(f"Starting Azure PR Reviewer from: {SCRIPT_DIR}", file=sys.stderr)
-
-# Try to load .env file with multiple strategies
-def load_env_file():
-    """Load .env file with multiple fallback strategies"""
-    env_file = SCRIPT_DIR / '.env'
+# Load the .env file next to this script; its values override inherited environment variables
+def load_env_file(env_file: Optional[Path] = None):
+    """Load .env file into the environment and verify the required variables"""
+    env_file = env_file or SCRIPT_DIR / '.env'
     
     if not env_file.exists():
         print(f"ERROR: .env file not found at {env_file}", file=sys.stderr)
@@ -29,41 +24,17 @@ def load_env_file():
         return False
     
     try:
-        from dotenv import load_dotenv
+        from dotenv import dotenv_values
         
-        # Try to load with override to ensure variables are set
+        # Parse the file once and apply it with override, like load_dotenv(override=True)
         print(f"Loading environment from: {env_file}", file=sys.stderr)
-        load_dotenv(env_file, override=True)
+        parsed = dotenv_values(env_file)
+        os.environ.update({key: value for key, value in parsed.items() if value is not None})
         
-        # Double-check by reading the file manually if needed
-        pat = os.getenv("AZURE_DEVOPS_PAT")
-        org = os.getenv("AZURE_DEVOPS_ORG")
-        
-        if not pat or not org:
-            print("Environment variables not loaded via dotenv, trying manual parse...", file=sys.stderr)
-            
-            # Manually parse the .env file as a fallback
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        # Remove inline comments
-                        if '#' in value:
-                            value = value.split('#')[0]
-                        value = value.strip().strip('"').strip("'")
-                        if key in ['AZURE_DEVOPS_PAT', 'AZURE_DEVOPS_ORG', 'AZURE_DEVOPS_PROJECT', 'WORKING_DIRECTORY']:
-                            os.environ[key] = value
-                            if key == 'AZURE_DEVOPS_PAT':
-                                print(f"Manually set {key}=***{value[-4:] if len(value) >= 4 else '***'}", file=sys.stderr)
-                            else:
-                                print(f"Manually set {key}={value}", file=sys.stderr)
+        pat = os.environ.get("AZURE_DEVOPS_PAT")
+        org = os.environ.get("AZURE_DEVOPS_ORG")
         
         # Final verification
-        pat = os.getenv("AZURE_DEVOPS_PAT")
-        org = os.getenv("AZURE_DEVOPS_ORG")
-        
         if not pat:
             print("ERROR: AZURE_DEVOPS_PAT not found in environment", file=sys.stderr)
             return False
@@ -81,26 +52,39 @@ def load_env_file():
         print(f"ERROR loading .env file: {e}", file=sys.stderr)
         return False
 
-# Load environment
-if not load_env_file():
-    sys.exit(1)
-
-# Import and start the server
-try:
-    # Set the working directory environment variable if not set
-    if not os.getenv("WORKING_DIRECTORY"):
-        os.environ["WORKING_DIRECTORY"] = str(SCRIPT_DIR / "temp_pr_analysis")
+def main():
+    """Load the environment and start the server"""
+    os.chdir(SCRIPT_DIR)
+    
+    # Add the project directory to Python path
+    sys.path.insert(0, str(SCRIPT_DIR))
     
-    # Import the server module
-    from azure_pr_reviewer import server
+    print(f"Starting Azure PR Reviewer from: {SCRIPT_DIR}", file=sys.stderr)
     
-    # Start the server
-    server.main()
+    # Load environment
+    if not load_env_file():
+        sys.exit(1)
     
-except ImportError as e:
-    print(f"ERROR: Failed to import server module: {e}", file=sys.stderr)
-    print("Make sure all dependencies are installed: pip install -r requirements.txt", file=sys.stderr)
-    sys.exit(1)
-except Exception as e:
-    print(f"ERROR: Server failed to start: {e}", file=sys.stderr)
-    sys.exit(1)
\ No newline at end of file
+    # Import and start the server
+    try:
+        # Set the working directory environment variable if not set
+        if not os.getenv("WORKING_DIRECTORY"):
+            os.environ["WORKING_DIRECTORY"] = str(SCRIPT_DIR / "temp_pr_analysis")
+        
+        # Import the server module
+        from azure_pr_reviewer import server
+        
+        # Start the server
+        server.main()
+        
+    except ImportError as e:
+        print(f"ERROR: Failed to import server module: {e}", file=sys.stderr)
+        print("Make sure all dependencies are installed: pip install -r requirements.txt", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"ERROR: Server failed to start: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 
 import asyncio
 import json
+from itertools import islice
 from azure_pr_reviewer.config import Settings
 from azure_pr_reviewer.azure_client import AzureDevOpsClient
 from azure_pr_reviewer.code_reviewer import CodeReviewer
@@ -14,21 +15,16 @@ async def test_pr_fetch():
     client = AzureDevOpsClient(settings)
     reviewer = CodeReviewer(settings)
     
-    print(f"Fetching PR #1364 from Zinnia repository...")
+    print(f"Fetching PR #1364 and its file changes from Zinnia repository...")
     
-    # Get PR details
-    pr = await client.get_pull_request(
-        "itdept0907", "Fidem", "Zinnia", 1364
+    # Get PR details and PR changes with content concurrently
+    pr, changes = await asyncio.gather(
+        client.get_pull_request("itdept0907", "Fidem", "Zinnia", 1364),
+        client.get_pull_request_changes("itdept0907", "Fidem", "Zinnia", 1364)
     )
     print(f"[OK] PR Title: {pr.title}")
     print(f"[OK] Created by: {pr.created_by.display_name}")
     
-    # Get PR changes with content
-    print("\nFetching file changes...")
-    changes = await client.get_pull_request_changes(
-        "itdept0907", "Fidem", "Zinnia", 1364
-    )
-    
     print(f"[OK] Found {len(changes)} file(s) changed")
     
     for change in changes:
@@ -50,16 +46,20 @@ async def test_pr_fetch():
             
             # Try to show a small diff preview
             print("\n   Sample of changes (first difference found):")
-            for i, (old, new) in enumerate(zip(old_lines[:100], new_lines[:100])):
-                if old != new:
-                    print(f"   Line {i+1}:")
-                    print(f"   - {old[:80]}")
-                    if len(old) > 80:
-                        print("...")
-                    print(f"   + {new[:80]}")
-                    if len(new) > 80:
-                        print("...")
-                    break
+            # Compare the first 100 line pairs lazily instead of copying both slices
+            first_difference = next(
+                ((i, old, new) for i, (old, new) in enumerate(islice(zip(old_lines, new_lines), 100)) if old != new),
+                None
+            )
+            if first_difference:
+                i, old, new = first_difference
+                print(f"   Line {i+1}:")
+                print(f"   - {old[:80]}")
+                if len(old) > 80:
+                    print("...")
+                print(f"   + {new[:80]}")
+                if len(new) > 80:
+                    print("...")
     
     # Test the review data preparation
     print("\n\nPreparing review data...")
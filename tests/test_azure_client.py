@@ -4,6 +4,7 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from datetime import datetime
 import asyncio
+import threading
 from azure_pr_reviewer.azure_client import AzureDevOpsClient
 from azure_pr_reviewer.config import Settings
 
@@ -45,6 +46,8 @@ class TestAzureDevOpsClient(unittest.TestCase):
             base_url="https://dev.azure.com/test-org",
             creds=mock_auth_instance
         )
+        self.assertTrue(client.git_client.config.keep_alive)
+        self.assertIn(429, client.git_client.config.retry_policy.policy.status_forcelist)
     
     def test_list_pull_requests(self):
         """Test listing pull requests"""
@@ -111,6 +114,22 @@ class TestAzureDevOpsClient(unittest.TestCase):
             self.assertEqual(result["email"], "test@example.com")
             self.assertEqual(result["display_name"], "test")
     
+    def test_get_current_user_reuses_profile(self):
+        """Test that the profile is only fetched once per client"""
+        mock_profile_client = Mock()
+        mock_profile_client.get_profile.return_value = Mock(
+            id="user-123", display_name="Test User",
+            email_address="test@example.com", unique_name="test@example.com"
+        )
+        self.client.connection.clients.get_profile_client.return_value = mock_profile_client
+        
+        first = asyncio.run(self.client.get_current_user())
+        second = asyncio.run(self.client.get_current_user())
+        
+        self.assertEqual(first["id"], "user-123")
+        self.assertEqual(second, first)
+        mock_profile_client.get_profile.assert_called_once_with("me")
+    
     def test_list_prs_needing_review(self):
         """Test listing PRs that need review"""
         # Mock PR with reviewer needing to review
@@ -212,6 +231,319 @@ class TestAzureDevOpsClient(unittest.TestCase):
         self.assertEqual(result[0]["change_type"], "edit")
         self.assertEqual(result[0]["new_content"], "test content")
     
+    def test_get_pull_request_changes_skips_binary_content(self):
+        """Test that binary files are flagged and not decoded or diffed"""
+        mock_pr = Mock()
+        mock_pr.target_ref_name = "refs/heads/main"
+        
+        mock_commit = Mock()
+        mock_commit.commit_id = "abc123"
+        mock_commit.comment = "Add logo"
+        
+        mock_change = Mock()
+        mock_change.item = Mock()
+        mock_change.item.path = "/assets/logo.dat"
+        mock_change.item.is_folder = False
+        mock_change.change_type = "edit"
+        mock_change.original_path = None
+        
+        mock_changes = Mock()
+        mock_changes.changes = [mock_change]
+        
+        with patch.object(self.client, 'get_pull_request') as mock_get_pr:
+            mock_get_pr.return_value = mock_pr
+            self.client.git_client.get_pull_request_commits.return_value = [mock_commit]
+            self.client.git_client.get_changes.return_value = mock_changes
+            self.client.git_client.get_item_content.return_value = iter([b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"])
+            
+            result = asyncio.run(self.client.get_pull_request_changes(
+                "test-org", "test-project", "test-repo", 123
+            ))
+        
+        self.assertTrue(result[0]["is_binary"])
+        self.assertEqual(result[0]["new_content"], "")
+        # Old content is not fetched for binary files
+        self.assertEqual(self.client.git_client.get_item_content.call_count, 1)
+    
+    def test_get_pull_request_changes_skips_fetch_for_binary_extensions(self):
+        """Test that files with binary extensions are never fetched"""
+        mock_pr = Mock()
+        mock_pr.target_ref_name = "refs/heads/main"
+        
+        mock_commit = Mock()
+        mock_commit.commit_id = "abc123"
+        mock_commit.comment = "Update library"
+        
+        mock_change = Mock()
+        mock_change.item = Mock()
+        mock_change.item.path = "/lib/Vendor.Library.DLL"
+        mock_change.item.is_folder = False
+        mock_change.change_type = "edit"
+        mock_change.original_path = None
+        
+        mock_changes = Mock()
+        mock_changes.changes = [mock_change]
+        
+        with patch.object(self.client, 'get_pull_request') as mock_get_pr:
+            mock_get_pr.return_value = mock_pr
+            self.client.git_client.get_pull_request_commits.return_value = [mock_commit]
+            self.client.git_client.get_changes.return_value = mock_changes
+            
+            result = asyncio.run(self.client.get_pull_request_changes(
+                "test-org", "test-project", "test-repo", 123
+            ))
+        
+        self.assertTrue(result[0]["is_binary"])
+        self.assertEqual(result[0]["new_content"], "")
+        self.client.git_client.get_item_content.assert_not_called()
+    
+    def test_get_pull_request_changes_keeps_commit_order(self):
+        """Test that concurrently fetched commit changes are applied in commit order"""
+        mock_pr = Mock()
+        mock_pr.target_ref_name = "refs/heads/main"
+        
+        commits = []
+        changes_by_commit = {}
+        for commit_id, path in [("first", "/src/a.cs"), ("second", "/src/a.cs")]:
+            commit = Mock()
+            commit.commit_id = commit_id
+            commit.comment = f"Commit {commit_id}"
+            commits.append(commit)
+            
+            change = Mock()
+            change.item = Mock()
+            change.item.path = path
+            change.item.is_folder = False
+            change.change_type = "add"
+            change.original_path = None
+            changes_by_commit[commit_id] = Mock(changes=[change])
+        
+        with patch.object(self.client, 'get_pull_request') as mock_get_pr:
+            mock_get_pr.return_value = mock_pr
+            self.client.git_client.get_pull_request_commits.return_value = commits
+            self.client.git_client.get_changes.side_effect = lambda commit_id, **kwargs: changes_by_commit[commit_id]
+            self.client.git_client.get_item_content.side_effect = (
+                lambda version_descriptor, **kwargs: iter([version_descriptor.version.encode()])
+            )
+            
+            result = asyncio.run(self.client.get_pull_request_changes(
+                "test-org", "test-project", "test-repo", 123
+            ))
+        
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["new_content"], "first")
+        self.assertEqual(self.client.git_client.get_changes.call_count, 2)
+    
+    def test_get_pull_request_changes_fetches_content_concurrently(self):
+        """Test that file contents for different paths are fetched in parallel"""
+        mock_pr = Mock()
+        mock_pr.target_ref_name = "refs/heads/main"
+        
+        mock_commit = Mock()
+        mock_commit.commit_id = "abc123"
+        mock_commit.comment = "Feature commit"
+        
+        mock_changes = Mock()
+        mock_changes.changes = []
+        for path in ["/src/a.cs", "/src/b.cs"]:
+            change = Mock()
+            change.item = Mock()
+            change.item.path = path
+            change.item.is_folder = False
+            change.change_type = "add"
+            change.original_path = None
+            mock_changes.changes.append(change)
+        
+        # Each fetch waits for the other one, so a serial implementation would time out
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def get_item_content(path, **kwargs):
+            barrier.wait()
+            return iter([path.encode()])
+        
+        with patch.object(self.client, 'get_pull_request') as mock_get_pr:
+            mock_get_pr.return_value = mock_pr
+            self.client.git_client.get_pull_request_commits.return_value = [mock_commit]
+            self.client.git_client.get_changes.return_value = mock_changes
+            self.client.git_client.get_item_content.side_effect = get_item_content
+            
+            result = asyncio.run(self.client.get_pull_request_changes(
+                "test-org", "test-project", "test-repo", 123
+            ))
+        
+        self.assertEqual([change["new_content"] for change in result], ["/src/a.cs", "/src/b.cs"])
+    
+    def test_get_pull_request_changes_reuses_commit_responses(self):
+        """Test that per-commit changes and contents are only fetched once across reviews"""
+        mock_pr = Mock()
+        mock_pr.target_ref_name = "refs/heads/main"
+        
+        mock_commit = Mock()
+        mock_commit.commit_id = "abc123"
+        mock_commit.comment = "Feature commit"
+        
+        mock_change = Mock()
+        mock_change.item = Mock()
+        mock_change.item.path = "/src/new.cs"
+        mock_change.item.is_folder = False
+        mock_change.change_type = "add"
+        mock_change.original_path = None
+        
+        with patch.object(self.client, 'get_pull_request') as mock_get_pr:
+            mock_get_pr.return_value = mock_pr
+            self.client.git_client.get_pull_request_commits.return_value = [mock_commit]
+            self.client.git_client.get_changes.return_value = Mock(changes=[mock_change])
+            self.client.git_client.get_item_content.side_effect = lambda **kwargs: iter([b"class New {}"])
+            
+            # Different PRs containing the same commit, so the PR-level cache is not involved
+            for pr_id in (123, 124):
+                result = asyncio.run(self.client.get_pull_request_changes(
+                    "test-org", "test-project", "test-repo", pr_id
+                ))
+                self.assertEqual(result[0]["new_content"], "class New {}")
+        
+        self.client.git_client.get_changes.assert_called_once()
+        self.client.git_client.get_item_content.assert_called_once()
+    
+    def test_get_pull_request_changes_does_not_cache_failed_content(self):
+        """Test that changes with blank content from a failed fetch are fetched again on the next call"""
+        mock_pr = Mock()
+        mock_pr.target_ref_name = "refs/heads/main"
+        
+        mock_commit = Mock()
+        mock_commit.commit_id = "abc123"
+        mock_commit.comment = "Feature commit"
+        
+        mock_change = Mock()
+        mock_change.item = Mock()
+        mock_change.item.path = "/src/new.cs"
+        mock_change.item.is_folder = False
+        mock_change.change_type = "add"
+        mock_change.original_path = None
+        
+        with patch.object(self.client, 'get_pull_request') as mock_get_pr:
+            mock_get_pr.return_value = mock_pr
+            self.client.git_client.get_pull_request_commits.return_value = [mock_commit]
+            self.client.git_client.get_changes.return_value = Mock(changes=[mock_change])
+            self.client.git_client.get_item_content.side_effect = [Exception("API Error"), iter([b"class New {}"])]
+            
+            results = [
+                asyncio.run(self.client.get_pull_request_changes("test-org", "test-project", "test-repo", 123))
+                for _ in range(3)
+            ]
+        
+        self.assertEqual(results[0][0]["new_content"], "")
+        self.assertEqual(results[1][0]["new_content"], "class New {}")
+        # The complete result is cached
+        self.assertEqual(results[2][0]["new_content"], "class New {}")
+        self.assertEqual(self.client.git_client.get_item_content.call_count, 2)
+    
+    def test_commit_content_cache_skips_binary_and_stays_within_budget(self):
+        """Test that binary and oversized contents are not cached and the total cached size is bounded"""
+        contents = {
+            "/logo.bin": b"\x89PNG\x00\x00",
+            "/big.txt": b"x" * 200,
+            "/a.txt": b"a" * 60,
+            "/b.txt": b"b" * 60,
+        }
+        self.client.git_client.get_item_content.side_effect = lambda path, **kwargs: iter([contents[path]])
+        
+        with patch('azure_pr_reviewer.azure_client.MAX_CACHED_CONTENT_ITEM_BYTES', 100), \
+             patch('azure_pr_reviewer.azure_client.MAX_CACHED_CONTENT_BYTES', 100):
+            for path in contents:
+                result = asyncio.run(self.client._get_commit_item_content("test-repo", "test-project", "abc123", path))
+                self.assertEqual(result, contents[path])
+        
+        # Only the most recent small text file fits in the budget
+        self.assertEqual(list(self.client._commit_content_cache), [("test-repo", "abc123", "/b.txt")])
+        self.assertEqual(self.client._commit_content_bytes, 60)
+    
+    def test_get_pull_request_reuses_recent_response(self):
+        """Test that PR details are cached until they expire or the cache is cleared"""
+        mock_pr = Mock()
+        mock_pr.title = "Test PR"
+        self.client.git_client.get_pull_request.return_value = mock_pr
+        
+        for _ in range(2):
+            result = asyncio.run(self.client.get_pull_request(
+                "test-org", "test-project", "test-repo", 123
+            ))
+            self.assertEqual(result, mock_pr)
+        self.assertEqual(self.client.git_client.get_pull_request.call_count, 1)
+        
+        with patch('azure_pr_reviewer.azure_client.time.monotonic', return_value=float('inf')):
+            asyncio.run(self.client.get_pull_request("test-org", "test-project", "test-repo", 123))
+        self.assertEqual(self.client.git_client.get_pull_request.call_count, 2)
+        
+        self.client.clear_cache()
+        asyncio.run(self.client.get_pull_request("test-org", "test-project", "test-repo", 123))
+        self.assertEqual(self.client.git_client.get_pull_request.call_count, 3)
+    
+    def test_concurrent_pull_request_fetches_are_shared(self):
+        """Test that concurrent lookups of one PR, including the one inside get_pull_request_changes, share a fetch"""
+        mock_pr = Mock()
+        mock_pr.title = "Test PR"
+        mock_pr.target_ref_name = "refs/heads/main"
+        self.client.git_client.get_pull_request.return_value = mock_pr
+        self.client.git_client.get_pull_request_commits.return_value = []
+        
+        async def fetch_all():
+            return await asyncio.gather(
+                self.client.get_pull_request("test-org", "test-project", "test-repo", 123),
+                self.client.get_pull_request("test-org", "test-project", "test-repo", 123),
+                self.client.get_pull_request_changes("test-org", "test-project", "test-repo", 123)
+            )
+        
+        first, second, changes = asyncio.run(fetch_all())
+        
+        self.assertIs(first, mock_pr)
+        self.assertIs(second, mock_pr)
+        self.assertEqual(changes, [])
+        self.client.git_client.get_pull_request.assert_called_once()
+    
+    def test_writes_invalidate_cached_pull_request(self):
+        """Test that posting comments drops the cached PR so the next read is fresh"""
+        old_pr, new_pr = Mock(title="Before"), Mock(title="After")
+        self.client.git_client.get_pull_request.side_effect = [old_pr, new_pr]
+        self.client.git_client.create_thread.return_value = Mock()
+        
+        self.assertIs(asyncio.run(self.client.get_pull_request("test-org", "test-project", "test-repo", 123)), old_pr)
+        asyncio.run(self.client.add_pull_request_comments(
+            "test-org", "test-project", "test-repo", 123, [{"content": "Comment"}]
+        ))
+        
+        self.assertIs(asyncio.run(self.client.get_pull_request("test-org", "test-project", "test-repo", 123)), new_pr)
+    
+    def test_approve_pull_request_returns_fresh_pull_request(self):
+        """Test that approval re-reads the PR instead of returning the one cached before voting"""
+        old_pr, new_pr = Mock(title="Before"), Mock(title="After")
+        self.client.git_client.get_pull_request.side_effect = [old_pr, new_pr]
+        self.client.git_client.create_thread.return_value = Mock()
+        
+        asyncio.run(self.client.get_pull_request("test-org", "test-project", "test-repo", 123))
+        result = asyncio.run(self.client.approve_pull_request("test-org", "test-project", "test-repo", 123))
+        
+        self.assertIs(result, new_pr)
+    
+    def test_get_pull_request_does_not_cache_errors(self):
+        """Test that a failed PR lookup is retried on the next call"""
+        mock_pr = Mock()
+        mock_pr.title = "Test PR"
+        self.client.git_client.get_pull_request.side_effect = [Exception("API Error"), mock_pr]
+        
+        with self.assertRaises(Exception):
+            asyncio.run(self.client.get_pull_request("test-org", "test-project", "test-repo", 123))
+        result = asyncio.run(self.client.get_pull_request("test-org", "test-project", "test-repo", 123))
+        self.assertEqual(result, mock_pr)
+    
+    def test_is_likely_binary(self):
+        """Test binary detection heuristics"""
+        self.assertFalse(self.client._is_likely_binary(b""))
+        self.assertFalse(self.client._is_likely_binary(b"public class Foo { }\n" * 1000))
+        self.assertFalse(self.client._is_likely_binary("caf\u00e9 na\u00efve".encode('utf-8')))
+        self.assertTrue(self.client._is_likely_binary(b"MZ\x90\x00\x03"))
+        self.assertTrue(self.client._is_likely_binary(bytes(range(1, 32)) * 300))
+    
     def test_add_pull_request_comments(self):
         """Test adding comments to a PR"""
         mock_thread = Mock()
@@ -236,9 +568,52 @@ class TestAzureDevOpsClient(unittest.TestCase):
             "test-org", "test-project", "test-repo", 123, comments
         ))
         
-        self.assertEqual(len(result), 2)
+        self.assertEqual(len(result["threads"]), 2)
+        self.assertEqual(result["errors"], [])
         self.assertEqual(self.client.git_client.create_thread.call_count, 2)
     
+    def test_add_pull_request_comments_reports_partial_failures(self):
+        """Test that a failed post is reported alongside the threads that were created"""
+        mock_thread = Mock()
+        self.client.git_client.create_thread.side_effect = [mock_thread, Exception("API Error"), mock_thread]
+        comments = [{"content": f"Comment {i}", "file_path": None, "line_number": None} for i in range(3)]
+        
+        result = asyncio.run(self.client.add_pull_request_comments(
+            "test-org", "test-project", "test-repo", 123, comments
+        ))
+        
+        self.assertEqual(result["threads"], [mock_thread, mock_thread])
+        self.assertEqual(len(result["errors"]), 1)
+        self.assertIn("API Error", result["errors"][0])
+        
+        # Nothing posted at all is still an error
+        self.client.git_client.create_thread.side_effect = Exception("API Error")
+        with self.assertRaises(Exception):
+            asyncio.run(self.client.add_pull_request_comments(
+                "test-org", "test-project", "test-repo", 123, comments
+            ))
+    
+    def test_add_pull_request_comments_posts_concurrently(self):
+        """Test that comment threads are posted in parallel and returned in order"""
+        # Each post waits for the other one, so a serial implementation would time out
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def create_thread(comment_thread, **kwargs):
+            barrier.wait()
+            return comment_thread.comments[0].content
+        
+        self.client.git_client.create_thread.side_effect = create_thread
+        comments = [
+            {"content": "First", "file_path": "/src/a.cs", "line_number": 1},
+            {"content": "Second", "file_path": None, "line_number": None}
+        ]
+        
+        result = asyncio.run(self.client.add_pull_request_comments(
+            "test-org", "test-project", "test-repo", 123, comments
+        ))
+        
+        self.assertEqual(result["threads"], ["First", "Second"])
+    
     def test_approve_pull_request(self):
         """Test approving a pull request"""
         mock_pr = Mock()
@@ -83,7 +83,7 @@ class TestCodeReviewer(unittest.TestCase):
         """Test getting review instructions for single file type"""
         file_types = {FileType.CSHARP: ["/src/test.cs", "/src/test2.cs"]}
         
-        with patch.object(self.reviewer.file_detector, 'should_use_mixed_review') as mock_mixed:
+        with patch.object(self.reviewer.file_detector, 'has_mixed_file_types') as mock_mixed:
             mock_mixed.return_value = False
             with patch.object(self.reviewer, '_get_prompt_for_type') as mock_get_prompt:
                 mock_get_prompt.return_value = "C# prompt"
@@ -100,7 +100,7 @@ class TestCodeReviewer(unittest.TestCase):
             FileType.JAVASCRIPT: ["/src/test.js"]
         }
         
-        with patch.object(self.reviewer.file_detector, 'should_use_mixed_review') as mock_mixed:
+        with patch.object(self.reviewer.file_detector, 'has_mixed_file_types') as mock_mixed:
             mock_mixed.return_value = True
             with patch.object(self.reviewer, '_get_combined_prompt') as mock_combined:
                 mock_combined.return_value = "Combined prompt"
@@ -125,6 +125,26 @@ class TestCodeReviewer(unittest.TestCase):
         finally:
             os.unlink(temp_file)
     
+    def test_get_prompt_for_type_reuses_unchanged_file(self):
+        """Test that a prompt file is only re-read after it changes"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+            f.write("First prompt")
+            temp_file = f.name
+        
+        try:
+            self.mock_settings.custom_review_prompt_file = temp_file
+            self.assertEqual(self.reviewer._get_prompt_for_type(FileType.CSHARP), "First prompt")
+            
+            with patch('builtins.open') as mock_open:
+                self.assertEqual(self.reviewer._get_prompt_for_type(FileType.CSHARP), "First prompt")
+                mock_open.assert_not_called()
+            
+            with open(temp_file, 'w') as f:
+                f.write("Updated prompt text")
+            self.assertEqual(self.reviewer._get_prompt_for_type(FileType.CSHARP), "Updated prompt text")
+        finally:
+            os.unlink(temp_file)
+    
     def test_get_prompt_for_type_default_fallback(self):
         """Test fallback to default prompt"""
         with patch('os.path.exists') as mock_exists:
@@ -1,6 +1,8 @@
 """Comprehensive unit tests for expanded security pattern detection"""
 
 import unittest
+import unittest.mock
+import threading
 from azure_pr_reviewer.security_detector import SecurityDetector
 
 
@@ -309,6 +311,60 @@ public class UserService {
         
         self.assertGreater(len(detected_categories), 2, 
                           f"Should detect multiple security categories. Found: {detected_categories}")
+    
+    def test_repeated_analysis_uses_cached_results(self):
+        """Test that rescanning identical content returns the same, independent results"""
+        code = 'public string RevealPassword() { return password; }'
+        
+        first = self.detector.analyze_file_security("User.cs", code)
+        first[0]["content"] = "mutated by caller"
+        
+        with unittest.mock.patch.object(self.detector, '_scan_content') as mock_scan:
+            second = self.detector.analyze_file_security("User.cs", code)
+            mock_scan.assert_not_called()
+        
+        self.assertEqual(len(second), 1)
+        self.assertIn("RevealPassword", second[0]["content"])
+        
+        # Different content for the same path is scanned again
+        self.assertEqual(self.detector.analyze_file_security("User.cs", "int x = 1;"), [])
+    
+    def test_batch_analysis_matches_single_file_analysis(self):
+        """Test that batch scanning matches per-file results"""
+        files = [
+            ("User.cs", 'public string RevealPassword() { return password; }\n' * 200),
+            ("Empty.cs", ""),
+            ("Clean.cs", "int x = 1;\n" * 200),
+        ]
+        expected = [SecurityDetector().analyze_file_security(path, content) for path, content in files]
+        
+        self.assertEqual(self.detector.analyze_files_security(files), expected)
+        
+        # A second batch is served from the cache
+        with unittest.mock.patch.object(self.detector, '_scan_content') as mock_scan:
+            self.assertEqual(self.detector.analyze_files_security(files), expected)
+            mock_scan.assert_not_called()
+    
+    def test_results_cache_is_thread_safe(self):
+        """Test that concurrent lookups and stores with evictions do not corrupt the cache"""
+        errors = []
+        
+        def worker(offset):
+            try:
+                for i in range(300):
+                    self.detector.analyze_file_security(f"File{(offset + i) % 50}.cs", f"int x = {i % 7};")
+            except Exception as e:
+                errors.append(e)
+        
+        with unittest.mock.patch('azure_pr_reviewer.security_detector.MAX_CACHED_RESULTS', 8):
+            threads = [threading.Thread(target=worker, args=(n * 13,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(self.detector._results_cache), 8)
 
 
 if __name__ == '__main__':
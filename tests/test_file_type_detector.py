@@ -148,6 +148,17 @@ class TestFileTypeDetector(unittest.TestCase):
         self.assertEqual(FileTypeDetector.detect_file_type("unknown.xyz"), FileType.DEFAULT)
         self.assertEqual(FileTypeDetector.detect_file_type("noextension"), FileType.DEFAULT)
     
+    def test_detect_file_type_caches_path_lookup(self):
+        """Test that path-based detection is cached while content checks still apply"""
+        FileTypeDetector._detect_file_type_from_path.cache_clear()
+        
+        self.assertEqual(FileTypeDetector.detect_file_type("settings.json"), FileType.JSON)
+        self.assertEqual(
+            FileTypeDetector.detect_file_type("settings.json", '{"dependencies": {}}'),
+            FileType.PACKAGE_JAVASCRIPT
+        )
+        self.assertEqual(FileTypeDetector._detect_file_type_from_path.cache_info().hits, 1)
+    
     def test_is_test_file(self):
         """Test identifying test files"""
         # C# test files
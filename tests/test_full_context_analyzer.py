@@ -0,0 +1,136 @@
+"""Unit tests for the full context analyzer"""
+
+import unittest
+import asyncio
+import tempfile
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import Mock, patch
+from azure_pr_reviewer.config import Settings
+from full_context_analyzer import FullContextAnalyzer, MAX_SCAN_BYTES
+
+
+class TestFullContextAnalyzer(unittest.TestCase):
+    """Test suite for FullContextAnalyzer"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.mock_settings = Mock(spec=Settings)
+        self.mock_settings.azure_organization = "test-org"
+        self.mock_settings.azure_pat = "test-pat"
+        self.mock_settings.working_directory = str(self.temp_dir / "work")
+        self.mock_settings.auto_cleanup = True
+        
+        with patch('azure_pr_reviewer.azure_client.Connection'):
+            self.analyzer = FullContextAnalyzer(self.mock_settings)
+    
+    def tearDown(self):
+        """Remove the temporary directory"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _populate(self, directory: Path):
+        """Create a small tree of files under directory"""
+        for i in range(20):
+            nested = directory / f"dir{i}"
+            nested.mkdir(parents=True, exist_ok=True)
+            (nested / "file.txt").write_text("content")
+    
+    def test_cleanup_leaves_no_trash_directories(self):
+        """Test that cleaning before and after an analysis removes every copy of the working directory"""
+        working_dir = self.analyzer.working_dir
+        self._populate(working_dir)
+        # Leftover from an earlier run that was interrupted mid-delete
+        self._populate(self.temp_dir / "work.trash-stale")
+        
+        self.analyzer._ensure_working_directory()
+        self.assertTrue(working_dir.exists())
+        self._populate(working_dir)
+        
+        self.analyzer._cleanup_working_directory()
+        
+        self.assertEqual(list(self.temp_dir.iterdir()), [])
+    
+    def _git(self, *args, cwd: Path):
+        """Run a git command, failing the test on errors"""
+        subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True)
+    
+    @unittest.skipUnless(shutil.which("git"), "git is not installed")
+    def test_sparse_checkout_matches_paths_literally(self):
+        """Test that sparse checkout materializes exactly the changed files and manifests"""
+        source = self.temp_dir / "source"
+        files = [
+            "src/weird[1].py", "src/weird1.py",   # [1] must not act as a character class
+            "src/#notes.md", "src/!bang.txt",     # leading # and ! must not be comments/negations
+            "src/star*.txt", "src/starry.txt",    # * must not act as a wildcard
+            "web/package.json", "docs/readme.md"
+        ]
+        for name in files:
+            (source / name).parent.mkdir(parents=True, exist_ok=True)
+            (source / name).write_text(name)
+        self._git("init", "-q", "-b", "main", cwd=source)
+        self._git("add", ".", cwd=source)
+        self._git("-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "init", cwd=source)
+        
+        clone = self.temp_dir / "clone"
+        self._git("clone", "-q", "--no-checkout", str(source), str(clone), cwd=self.temp_dir)
+        
+        self.analyzer._sparse_checkout(
+            clone, "main", ["/src/weird[1].py", "/src/#notes.md", "/src/!bang.txt", "/src/star*.txt"]
+        )
+        
+        checked_out = sorted(
+            str(path.relative_to(clone)).replace("\\", "/")
+            for path in clone.rglob("*") if path.is_file() and ".git" not in path.parts
+        )
+        self.assertEqual(checked_out, [
+            "src/!bang.txt", "src/#notes.md", "src/star*.txt", "src/weird[1].py", "web/package.json"
+        ])
+    
+    def test_sparse_checkout_timeout_is_reported(self):
+        """Test that a hanging sparse-checkout step is bounded by a timeout"""
+        with patch('full_context_analyzer.subprocess.run', side_effect=subprocess.TimeoutExpired("git", 60)) as mock_run:
+            with self.assertRaises(Exception) as context:
+                self.analyzer._sparse_checkout(self.temp_dir, "main", ["/src/a.py"])
+        
+        self.assertIn("timed out", str(context.exception))
+        self.assertEqual(mock_run.call_args.kwargs["timeout"], 60)
+    
+    def test_analyze_full_repository_skips_binary_and_large_files(self):
+        """Test that binary, oversized and missing files are skipped without being read"""
+        repo = self.temp_dir / "repo"
+        (repo / "src").mkdir(parents=True)
+        (repo / "src" / "config.py").write_text('password = "hunter2"\n')
+        (repo / "logo.png").write_text('password = "hunter2"\n')
+        (repo / "big.js").write_text('password = "hunter2"\n' + "x" * MAX_SCAN_BYTES)
+        
+        with patch.object(FullContextAnalyzer, '_read_file', autospec=True, side_effect=FullContextAnalyzer._read_file) as mock_read:
+            result = asyncio.run(self.analyzer.analyze_full_repository(
+                repo, ["/src/config.py", "/logo.png", "/big.js", "/missing.cs"]
+            ))
+        
+        read_paths = {call.args[1].name for call in mock_read.call_args_list}
+        self.assertNotIn("logo.png", read_paths)
+        self.assertEqual(result["files_analyzed"], 1)
+        self.assertTrue(result["issues"])
+        self.assertTrue(all(issue["file_path"] == "/src/config.py" for issue in result["issues"]))
+    
+    def test_analyze_full_repository_keeps_order_and_survives_read_errors(self):
+        """Test that concurrently read files are reported in changed-file order and read errors are isolated"""
+        repo = self.temp_dir / "repo"
+        (repo / "src" / "folder.cs").mkdir(parents=True)  # reading a directory fails
+        for name in ("b.py", "a.py"):
+            (repo / "src" / name).write_text('password = "hunter2"\n')
+        
+        result = asyncio.run(self.analyzer.analyze_full_repository(
+            repo, ["/src/b.py", "/src/folder.cs", "/src/a.py"]
+        ))
+        
+        self.assertEqual(result["files_analyzed"], 2)
+        reported = [issue["file_path"] for issue in result["issues"]]
+        self.assertEqual(sorted(set(reported), key=reported.index), ["/src/b.py", "/src/a.py"])
+
+
+if __name__ == '__main__':
+    unittest.main()
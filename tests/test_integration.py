@@ -174,7 +174,7 @@ class TestIntegration(unittest.TestCase):
             parsed_review["comments"]
         ))
         
-        self.assertEqual(len(threads), 2)
+        self.assertEqual(len(threads["threads"]), 2)
         self.assertEqual(mock_git_client.create_thread.call_count, 2)
     
     def test_file_type_detection_in_review_flow(self):
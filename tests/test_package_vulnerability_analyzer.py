@@ -0,0 +1,51 @@
+"""Unit tests for package file discovery in the vulnerability analyzer"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from package_vulnerability_analyzer import PackageVulnerabilityAnalyzer
+
+
+class TestPackageFileDiscovery(unittest.TestCase):
+    """Test suite for PackageVulnerabilityAnalyzer._find_all_package_files"""
+    
+    def setUp(self):
+        """Set up a repository tree with package files in and out of skipped directories"""
+        self.repo = Path(tempfile.mkdtemp())
+        files = [
+            "package.json", "web/yarn.lock", "web/node_modules/lib/package.json",
+            "src/App/App.CSPROJ", "src/Directory.Build.props", "src/obj/Generated.csproj",
+            "requirements.txt", "requirements-dev.txt", "tools/Pipfile", ".venv/setup.py",
+            "java/pom.xml", "php/composer.lock", "vendor/composer.json",
+            "README.md", "src/package.json.bak"
+        ]
+        for name in files:
+            path = self.repo / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("")
+        self.analyzer = PackageVulnerabilityAnalyzer(self.repo)
+    
+    def tearDown(self):
+        """Remove the temporary repository"""
+        shutil.rmtree(self.repo, ignore_errors=True)
+    
+    def test_find_all_package_files(self):
+        """Test exact and wildcard matches, case-insensitively, outside skipped directories"""
+        found = self.analyzer._find_all_package_files(self.repo)
+        
+        relative = {
+            pkg_type: sorted(str(path.relative_to(self.repo)).replace("\\", "/") for path in paths)
+            for pkg_type, paths in found.items()
+        }
+        self.assertEqual(relative, {
+            "npm": ["package.json", "web/yarn.lock"],
+            "nuget": ["src/App/App.CSPROJ", "src/Directory.Build.props"],
+            "pip": ["requirements-dev.txt", "requirements.txt", "tools/Pipfile"],
+            "maven": ["java/pom.xml"],
+            "composer": ["php/composer.lock"]
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Unit tests for .env loading in the robust start script"""
+
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+from start_server_robust import load_env_file
+
+
+class TestLoadEnvFile(unittest.TestCase):
+    """Test suite for start_server_robust.load_env_file"""
+    
+    def setUp(self):
+        """Create a temporary .env file"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.env_file = self.temp_dir / ".env"
+        self.env_file.write_text(
+            "AZURE_DEVOPS_PAT=file-pat-1234\n"
+            "AZURE_DEVOPS_ORG=file-org # inline comment\n"
+        )
+    
+    def tearDown(self):
+        """Remove the temporary directory"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    @patch.dict(os.environ, {
+        "AZURE_DEVOPS_PAT": "env-pat-5678",
+        "AZURE_DEVOPS_ORG": "env-org",
+        "AZURE_DEVOPS_PROJECT": "env-project"
+    })
+    def test_env_file_overrides_existing_environment(self):
+        """Test that .env values win over variables already set, as load_dotenv(override=True) did"""
+        self.assertTrue(load_env_file(self.env_file))
+        
+        self.assertEqual(os.environ["AZURE_DEVOPS_PAT"], "file-pat-1234")
+        self.assertEqual(os.environ["AZURE_DEVOPS_ORG"], "file-org")
+        # Variables the file does not mention are left alone
+        self.assertEqual(os.environ["AZURE_DEVOPS_PROJECT"], "env-project")
+    
+    @patch.dict(os.environ, {}, clear=True)
+    def test_missing_required_variable(self):
+        """Test that a .env file without the organization is rejected"""
+        self.env_file.write_text("AZURE_DEVOPS_PAT=file-pat-1234\n")
+        
+        self.assertFalse(load_env_file(self.env_file))
+    
+    def test_missing_env_file(self):
+        """Test that a missing .env file is rejected"""
+        self.assertFalse(load_env_file(self.temp_dir / "missing.env"))
+
+
+if __name__ == '__main__':
+    unittest.main()